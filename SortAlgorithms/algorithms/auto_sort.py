@@ -0,0 +1,171 @@
+import json
+import os
+import random
+import time
+from algorithms.sort_strategy_interface import SortStrategy
+from algorithms.counting_sort import CountingSort
+from algorithms.insertion_sort import InsertionSort
+from algorithms.intro_sort import IntroSort
+from algorithms.radix_sort import RadixSort
+from algorithms.tim_sort import TimSort
+
+THRESHOLDS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'results', 'auto_sort_thresholds.json'
+)
+
+# Valores usados enquanto não existir um arquivo calibrado na máquina
+DEFAULT_THRESHOLDS = {
+    'small_size': 32,             # até esse tamanho, insertion sort
+    'counting_range_ratio': 2.0,  # amplitude <= ratio * n: counting sort
+    'radix_min_size': 4096,       # inteiros com amplitude larga a partir desse tamanho: radix sort
+    'presorted_descent_ratio': 0.05,  # fração de descidas na amostra abaixo disso: merge adaptativo
+}
+
+SAMPLE_WINDOWS = 32
+WINDOW_SIZE = 32
+
+
+class DataProfile:
+    def __init__(self, size, integers, min_val, max_val, duplicate_ratio, descent_ratio):
+        self.size = size
+        self.integers = integers
+        self.min_val = min_val
+        self.max_val = max_val
+        self.duplicate_ratio = duplicate_ratio
+        self.descent_ratio = descent_ratio  # 0 = já ordenado, ~0.5 = aleatório, 1 = invertido
+
+    @property
+    def value_range(self):
+        return self.max_val - self.min_val + 1 if self.size else 0
+
+
+def profile_data(arr, windows=SAMPLE_WINDOWS, window_size=WINDOW_SIZE):
+    """Perfil barato da entrada a partir de janelas contíguas espalhadas pelo array."""
+    n = len(arr)
+    if n == 0:
+        return DataProfile(0, True, 0, 0, 0.0, 0.0)
+    sample = []
+    descents = 0
+    pairs = 0
+    step = max(1, (n - window_size) // max(1, windows - 1))
+    for start in range(0, max(1, n - window_size + 1), step):
+        window = [arr[i] for i in range(start, min(start + window_size, n))]
+        descents += sum(1 for a, b in zip(window, window[1:]) if a > b)
+        pairs += len(window) - 1
+        sample.extend(window)
+        if len(sample) >= windows * window_size:
+            break
+    integers = all(isinstance(v, int) or getattr(v, 'dtype', None) is not None and v.dtype.kind in 'iu'
+                   for v in sample)
+    if integers:
+        # Escalares numpy (int64/uint64) estourariam em max_val - min_val; int do Python não
+        sample = [int(v) for v in sample]
+    return DataProfile(
+        size=n,
+        integers=integers,
+        min_val=min(sample),
+        max_val=max(sample),
+        duplicate_ratio=1 - len(set(sample)) / len(sample),
+        descent_ratio=descents / pairs if pairs else 0.0,
+    )
+
+
+def load_thresholds(path=THRESHOLDS_FILE):
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    try:
+        with open(path, 'r') as f:
+            thresholds.update(json.load(f).get('thresholds', {}))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return thresholds
+
+
+class AutoSort(SortStrategy):
+    """Escolhe a estratégia a partir de um perfil amostral da entrada."""
+    # O perfil da entrada assume inteiros
+    comparison_based = False
+
+    def __init__(self, thresholds=None, thresholds_file=THRESHOLDS_FILE):
+        self.thresholds = thresholds or load_thresholds(thresholds_file)
+        self.last_choice = None
+
+    def choose(self, arr):
+        profile = profile_data(arr)
+        t = self.thresholds
+        if profile.size <= t['small_size']:
+            return InsertionSort()
+        if profile.descent_ratio <= t['presorted_descent_ratio'] or profile.descent_ratio >= 1 - t['presorted_descent_ratio']:
+            return TimSort()
+        if profile.integers:
+            # Counting e radix trabalham sobre (valor - mínimo), então negativos também servem
+            # A amostra subestima a amplitude; a folga evita vetores de contagem gigantes
+            if profile.value_range <= t['counting_range_ratio'] * profile.size:
+                return CountingSort()
+            if profile.size >= t['radix_min_size']:
+                return RadixSort()
+        return IntroSort()
+
+    def sort(self, arr):
+        self.last_choice = self.choose(arr)
+        self.last_choice.sort(arr)
+
+    def sort_buffer(self, arr):
+        self.last_choice = self.choose(arr)
+        self.last_choice.sort_buffer(arr)
+
+
+def _time_strategy(strategy, data, repetitions=3):
+    best = float('inf')
+    for _ in range(repetitions):
+        arr = list(data)
+        start = time.perf_counter()
+        strategy.sort(arr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(path=THRESHOLDS_FILE, sizes=(16, 32, 64, 128, 1024, 4096, 16384), seed=0):
+    """Mede os pontos de cruzamento entre as estratégias nesta máquina e salva os limiares."""
+    rng = random.Random(seed)
+    intro = IntroSort()
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    measurements = []
+
+    # Tamanho até o qual insertion sort vence o introsort
+    small = sizes[0]
+    for n in sizes:
+        data = [rng.randint(0, 10 ** 6) for _ in range(n)]
+        insertion, hybrid = _time_strategy(InsertionSort(), data), _time_strategy(intro, data)
+        measurements.append({'test': 'small', 'size': n, 'insertion': insertion, 'intro': hybrid})
+        if insertion <= hybrid:
+            small = n
+    thresholds['small_size'] = small
+
+    # Maior razão amplitude/n em que counting sort ainda vence o introsort
+    n = sizes[-1]
+    ratio = 1.0
+    for candidate in (1, 2, 4, 8, 16, 32, 64):
+        data = [rng.randint(0, int(candidate * n) - 1) for _ in range(n)]
+        counting, hybrid = _time_strategy(CountingSort(), data), _time_strategy(intro, data)
+        measurements.append({'test': 'counting', 'ratio': candidate, 'counting': counting, 'intro': hybrid})
+        if counting <= hybrid:
+            ratio = candidate
+    thresholds['counting_range_ratio'] = ratio
+
+    # Menor tamanho a partir do qual radix sort vence com amplitude de 32 bits
+    radix_min = None
+    for n in sizes:
+        data = [rng.randint(0, 2 ** 31) for _ in range(n)]
+        radix, hybrid = _time_strategy(RadixSort(), data), _time_strategy(intro, data)
+        measurements.append({'test': 'radix', 'size': n, 'radix': radix, 'intro': hybrid})
+        if radix_min is None and radix <= hybrid:
+            radix_min = n
+    thresholds['radix_min_size'] = radix_min if radix_min is not None else float('inf')
+
+    with open(path, 'w') as f:
+        json.dump({'thresholds': thresholds, 'measurements': measurements}, f, indent=2)
+    return thresholds
+
+
+if __name__ == "__main__":
+    print(calibrate())
@@ -0,0 +1,127 @@
+from bisect import bisect_left, bisect_right
+from math import isqrt
+from algorithms.sort_strategy_interface import SortStrategy
+
+# Tamanho das runs iniciais, ordenadas por inserção
+RUN_SIZE = 16
+# Sem buffer, as rotações trabalham em pedaços deste tamanho: memória extra O(1)
+MIN_CHUNK = 8
+
+
+class BlockMergeSort(SortStrategy):
+    """Merge sort estável e in-place: as runs são intercaladas por rotações (SymMerge).
+
+    Com use_buffer, merges em que um dos lados cabe em √n elementos usam uma cópia
+    desse lado, e as rotações copiam no máximo √n por vez; sem buffer, a memória
+    extra é constante (fora a pilha de recursão O(log n)).
+    Buffers (sort_buffer) continuam no sort estável do numpy.
+    """
+
+    def __init__(self, use_buffer=True, run_size=RUN_SIZE):
+        self.use_buffer = use_buffer
+        self.run_size = run_size
+
+    def sort(self, arr):
+        n = len(arr)
+        if n < 2:
+            return
+        self.buffer_size = isqrt(n) if self.use_buffer else 0
+        self.chunk = max(MIN_CHUNK, self.buffer_size)
+        for lo in range(0, n, self.run_size):
+            self.insertion_sort(arr, lo, min(lo + self.run_size, n))
+        width = self.run_size
+        while width < n:
+            for lo in range(0, n - width, 2 * width):
+                self.merge(arr, lo, lo + width, min(lo + 2 * width, n))
+            width *= 2
+
+    def insertion_sort(self, arr, lo, hi):
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and key < arr[j]:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    def merge(self, arr, lo, mid, hi):
+        # Intercala arr[lo:mid] e arr[mid:hi]; em empates, o lado esquerdo vem primeiro
+        if lo >= mid or mid >= hi or not arr[mid] < arr[mid - 1]:
+            return
+        if mid - lo <= self.buffer_size:
+            self.merge_forward(arr, lo, mid, hi)
+        elif hi - mid <= self.buffer_size:
+            self.merge_backward(arr, lo, mid, hi)
+        elif mid - lo == 1:
+            self.rotate(arr, lo, mid, bisect_left(arr, arr[lo], mid, hi))
+        elif hi - mid == 1:
+            self.rotate(arr, bisect_right(arr, arr[mid], lo, mid), mid, hi)
+        else:
+            self.sym_merge(arr, lo, mid, hi)
+
+    def sym_merge(self, arr, lo, mid, hi):
+        # SymMerge (Kim & Kutzner): acha a divisão simétrica em torno do meio,
+        # rotaciona o trecho central e resolve as duas metades
+        half = (lo + hi) // 2
+        total = half + mid
+        if mid > half:
+            start, r = total - hi, half
+        else:
+            start, r = lo, mid
+        p = total - 1
+        while start < r:
+            c = (start + r) // 2
+            if not arr[p - c] < arr[c]:
+                start = c + 1
+            else:
+                r = c
+        end = total - start
+        if start < mid < end:
+            self.rotate(arr, start, mid, end)
+        if lo < start < half:
+            self.merge(arr, lo, start, half)
+        if half < end < hi:
+            self.merge(arr, half, end, hi)
+
+    def merge_forward(self, arr, lo, mid, hi):
+        left = arr[lo:mid]
+        i, j, k = 0, mid, lo
+        while i < len(left) and j < hi:
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
+                j += 1
+            else:
+                arr[k] = left[i]
+                i += 1
+            k += 1
+        arr[k:k + len(left) - i] = left[i:]
+
+    def merge_backward(self, arr, lo, mid, hi):
+        right = arr[mid:hi]
+        i, j, k = mid - 1, len(right) - 1, hi - 1
+        while i >= lo and j >= 0:
+            if right[j] < arr[i]:
+                arr[k] = arr[i]
+                i -= 1
+            else:
+                arr[k] = right[j]
+                j -= 1
+            k -= 1
+        arr[lo:lo + j + 1] = right[:j + 1]
+
+    def rotate(self, arr, lo, mid, hi):
+        # Três reversões: [A B] -> [B A]
+        self.reverse(arr, lo, mid)
+        self.reverse(arr, mid, hi)
+        self.reverse(arr, lo, hi)
+
+    def reverse(self, arr, lo, hi):
+        # Troca pedaços das pontas para nunca copiar mais que chunk elementos por vez
+        chunk = self.chunk
+        while hi - lo > 2 * chunk:
+            left = arr[lo:lo + chunk]
+            arr[lo:lo + chunk] = arr[hi - chunk:hi][::-1]
+            arr[hi - chunk:hi] = left[::-1]
+            lo += chunk
+            hi -= chunk
+        arr[lo:hi] = arr[lo:hi][::-1]
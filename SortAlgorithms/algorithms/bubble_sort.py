@@ -6,4 +6,10 @@ class BubbleSort(SortStrategy):
         for i in range(n):
             for j in range(0, n-i-1):
                 if arr[j] > arr[j+1]:
-                    arr[j], arr[j+1] = arr[j+1], arr[j]
\ No newline at end of file
+                    arr[j], arr[j+1] = arr[j+1], arr[j]
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import odd_even_pass
+        # Ordenação par-ímpar: cada fase compara todos os pares adjacentes de uma vez
+        for i in range(len(arr)):
+            odd_even_pass(arr, i % 2)
\ No newline at end of file
@@ -10,4 +10,15 @@ class BubbleSortOptimized(SortStrategy):
                     arr[j], arr[j+1] = arr[j+1], arr[j]
                     swapped = True
             if not swapped:
-                break
\ No newline at end of file
+                break
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import odd_even_pass
+        idle = 0
+        i = 0
+        while idle < 2:
+            if odd_even_pass(arr, i % 2):
+                idle = 0
+            else:
+                idle += 1
+            i += 1
\ No newline at end of file
@@ -0,0 +1,130 @@
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional; sem ele só a versão com listas fica disponível
+    np = None
+
+# Abaixo deste tamanho os blocos são ordenados diretamente antes das intercalações
+SMALL_BLOCK = 1024
+
+
+def is_buffer(obj):
+    """Indica se o objeto expõe o buffer protocol (array.array, numpy.ndarray, memoryview)."""
+    if isinstance(obj, (list, tuple)):
+        return False
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def as_array(buf):
+    """Retorna um ndarray 1-D que compartilha a memória do buffer, sem cópia."""
+    if np is None:
+        raise RuntimeError("O backend de buffer requer numpy instalado.")
+    arr = np.asarray(buf)
+    if arr.ndim != 1:
+        raise ValueError("O backend de buffer só aceita buffers unidimensionais.")
+    if not arr.flags.writeable:
+        raise ValueError("O buffer precisa ser gravável para a ordenação in-place.")
+    return arr
+
+
+def require_integers(arr):
+    if arr.dtype.kind not in "iu":
+        raise TypeError(f"Tipo {arr.dtype} não suportado: esperado buffer de inteiros.")
+
+
+def offset_keys(arr, min_val):
+    """(arr - min_val) em uint64, sem transbordar em dtypes estreitos (int8, int16...).
+
+    A conversão e a subtração são módulo 2^64, então o resultado é exato para qualquer
+    buffer de inteiros; desfaça com (keys + offset).astype(arr.dtype).
+    """
+    offset = np.uint64(min_val % (1 << 64))
+    return arr.astype(np.uint64) - offset, offset
+
+
+def merge_runs(src, dst, lo, mid, hi):
+    """Intercala de forma estável src[lo:mid] e src[mid:hi] em dst[lo:hi]."""
+    left = src[lo:mid]
+    right = src[mid:hi]
+    if len(left) == 0 or len(right) == 0 or left[-1] <= right[0]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    # Posição final de cada elemento = posição na própria run + quantos elementos
+    # da outra run vêm antes dele (empates favorecem a run da esquerda)
+    out = dst[lo:hi]
+    out[np.arange(len(left)) + np.searchsorted(right, left, side="left")] = left
+    out[np.arange(len(right)) + np.searchsorted(left, right, side="right")] = right
+
+
+def bottom_up_merge_sort(arr):
+    n = len(arr)
+    if n < 2:
+        return
+    # Ordena blocos pequenos de uma vez só e depois intercala em passadas
+    full = n - n % SMALL_BLOCK
+    if full:
+        arr[:full].reshape(-1, SMALL_BLOCK).sort(axis=1, kind="stable")
+    arr[full:].sort(kind="stable")
+    src, dst = arr, np.empty_like(arr)
+    width = SMALL_BLOCK
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_runs(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    if src is not arr:
+        arr[:] = src
+
+
+def partition3(arr, lo, hi, pivot):
+    """Particiona arr[lo:hi] em < pivot, == pivot e > pivot; retorna os limites do meio."""
+    seg = arr[lo:hi]
+    less = seg[seg < pivot]
+    greater = seg[seg > pivot]
+    n_less = len(less)
+    n_greater = len(greater)
+    seg[:n_less] = less
+    seg[n_less:len(seg) - n_greater] = pivot
+    seg[len(seg) - n_greater:] = greater
+    return lo + n_less, hi - n_greater
+
+
+def quick_sort(arr, depth_limit=None):
+    # Com depth_limit, segmentos que passam do limite caem para heapsort (introsort)
+    stack = [(0, len(arr), depth_limit)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= SMALL_BLOCK:
+            arr[lo:hi].sort()
+            continue
+        if depth == 0:
+            arr[lo:hi].sort(kind="heapsort")
+            continue
+        if depth is not None:
+            depth -= 1
+        a, b, c = arr[lo], arr[(lo + hi) // 2], arr[hi - 1]
+        pivot = max(min(a, b), min(max(a, b), c))  # mediana de três
+        eq_lo, eq_hi = partition3(arr, lo, hi, pivot)
+        stack.append((lo, eq_lo, depth))
+        stack.append((eq_hi, hi, depth))
+
+
+def odd_even_pass(arr, start):
+    """Uma fase da ordenação par-ímpar: compara e troca todos os pares (i, i+1) de uma vez."""
+    left = arr[start:len(arr) - 1:2]
+    right = arr[start + 1::2]
+    size = min(len(left), len(right))
+    left = left[:size]
+    right = right[:size]
+    swap = left > right
+    if not swap.any():
+        return False
+    tmp = left[swap]
+    left[swap] = right[swap]
+    right[swap] = tmp
+    return True
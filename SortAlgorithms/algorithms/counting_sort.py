@@ -1,16 +1,52 @@
 from algorithms.sort_strategy_interface import SortStrategy
 
+# Amplitude mínima sempre tratada com vetor de contagem, mesmo em entradas pequenas
+DENSE_MIN_RANGE = 1024
+
 class CountingSort(SortStrategy):
+    comparison_based = False
+
+    def __init__(self, max_dense_ratio=8):
+        # Vetor de contagem só quando a amplitude não passa de max_dense_ratio * n;
+        # acima disso a contagem vai para um dict e só os valores distintos são ordenados
+        self.max_dense_ratio = max_dense_ratio
+
+    def is_dense(self, size, value_range):
+        return value_range <= max(self.max_dense_ratio * size, DENSE_MIN_RANGE)
+
     def sort(self, arr):
         if not arr:
             return
+        min_val = min(arr)
         max_val = max(arr)
-        count = [0] * (max_val + 1)
-        for num in arr:
-            count[num] += 1
+        if self.is_dense(len(arr), max_val - min_val + 1):
+            # Contagem sobre [min, max]: negativos e valores altos não inflam o vetor
+            count = [0] * (max_val - min_val + 1)
+            for num in arr:
+                count[num - min_val] += 1
+            values = range(min_val, max_val + 1)
+        else:
+            count = {}
+            for num in arr:
+                count[num] = count.get(num, 0) + 1
+            values = sorted(count)
+            count = [count[value] for value in values]
         index = 0
-        for i in range(len(count)):
-            while count[i] > 0:
-                arr[index] = i
-                index += 1
-                count[i] -= 1
\ No newline at end of file
+        for value, freq in zip(values, count):
+            if freq:
+                arr[index:index + freq] = [value] * freq
+                index += freq
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import np, offset_keys, require_integers
+        if len(arr) == 0:
+            return
+        require_integers(arr)
+        min_val = int(arr.min())
+        max_val = int(arr.max())
+        if self.is_dense(len(arr), max_val - min_val + 1):
+            count = np.bincount(offset_keys(arr, min_val)[0].astype(np.intp))
+            values = np.arange(min_val, min_val + len(count), dtype=arr.dtype)
+        else:
+            values, count = np.unique(arr, return_counts=True)
+        arr[:] = np.repeat(values, count)
@@ -4,4 +4,7 @@ class HeapSort(SortStrategy):
     def sort(self, arr):
         import heapq
         heapq.heapify(arr)
-        arr[:] = [heapq.heappop(arr) for _ in range(len(arr))]
\ No newline at end of file
+        arr[:] = [heapq.heappop(arr) for _ in range(len(arr))]
+
+    def sort_buffer(self, arr):
+        arr.sort(kind="heapsort")
\ No newline at end of file
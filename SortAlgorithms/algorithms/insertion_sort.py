@@ -8,4 +8,14 @@ class InsertionSort(SortStrategy):
             while j >= 0 and key < arr[j]:
                 arr[j + 1] = arr[j]
                 j -= 1
-            arr[j + 1] = key
\ No newline at end of file
+            arr[j + 1] = key
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import np
+        # Inserção binária: a posição vem de searchsorted e o deslocamento é um memmove
+        for i in range(1, len(arr)):
+            key = arr[i]
+            j = int(np.searchsorted(arr[:i], key, side="right"))
+            if j < i:
+                arr[j + 1:i + 1] = arr[j:i]
+                arr[j] = key
\ No newline at end of file
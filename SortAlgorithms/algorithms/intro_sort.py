@@ -0,0 +1,122 @@
+from algorithms.sort_strategy_interface import SortStrategy
+
+class IntroSort(SortStrategy):
+    """Quicksort híbrido (introsort) com fallback para heapsort e insertion sort."""
+
+    def __init__(self, cutoff=16, ninther_threshold=128):
+        self.cutoff = cutoff
+        self.ninther_threshold = ninther_threshold
+
+    def sort(self, arr):
+        n = len(arr)
+        if n > 1:
+            self.intro_sort(arr, 0, n, 2 * n.bit_length())
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import quick_sort
+        quick_sort(arr, depth_limit=2 * max(len(arr), 1).bit_length())
+
+    def intro_sort(self, arr, lo, hi, depth):
+        # Recursão só no lado menor; o maior continua no laço (pilha O(log n))
+        while hi - lo > self.cutoff:
+            if depth == 0:
+                self.heap_sort(arr, lo, hi)
+                return
+            if self.presorted(arr, lo, hi):
+                return
+            depth -= 1
+            lt, gt = self.partition(arr, lo, hi, self.choose_pivot(arr, lo, hi))
+            if lt - lo < hi - gt:
+                self.intro_sort(arr, lo, lt, depth)
+                lo = gt
+            else:
+                self.intro_sort(arr, gt, hi, depth)
+                hi = lt
+        self.insertion_sort(arr, lo, hi)
+
+    def presorted(self, arr, lo, hi):
+        # Em dados aleatórios as varreduras param logo na primeira inversão
+        i = lo + 1
+        while i < hi and arr[i - 1] <= arr[i]:
+            i += 1
+        if i == hi:
+            return True
+        if i == lo + 1:
+            while i < hi and arr[i - 1] >= arr[i]:
+                i += 1
+            if i == hi:
+                arr[lo:hi] = arr[lo:hi][::-1]
+                return True
+        return False
+
+    def choose_pivot(self, arr, lo, hi):
+        mid = (lo + hi) // 2
+        if hi - lo < self.ninther_threshold:
+            return self.median_of_three(arr, lo, mid, hi - 1)
+        step = (hi - lo) // 8
+        return self.median_of_three(
+            arr,
+            self.median_of_three(arr, lo, lo + step, lo + 2 * step),
+            self.median_of_three(arr, mid - step, mid, mid + step),
+            self.median_of_three(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1),
+        )
+
+    def median_of_three(self, arr, a, b, c):
+        # Retorna o índice do elemento mediano
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        return c if arr[b] < arr[c] else b
+
+    def partition(self, arr, lo, hi, pivot_index):
+        # Partição em três vias (Dijkstra): [lo, lt) < pivô, [lt, gt) == pivô, [gt, hi) > pivô
+        pivot = arr[pivot_index]
+        lt = lo
+        i = lo
+        gt = hi
+        while i < gt:
+            value = arr[i]
+            if value < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                lt += 1
+                i += 1
+            elif value > pivot:
+                gt -= 1
+                arr[i], arr[gt] = arr[gt], value
+            else:
+                i += 1
+        return lt, gt
+
+    def insertion_sort(self, arr, lo, hi):
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and key < arr[j]:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    def heap_sort(self, arr, lo, hi):
+        n = hi - lo
+        for i in range(n // 2 - 1, -1, -1):
+            self.sift_down(arr, lo, i, n)
+        for end in range(n - 1, 0, -1):
+            arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+            self.sift_down(arr, lo, 0, end)
+
+    def sift_down(self, arr, lo, root, size):
+        while True:
+            largest = root
+            left = 2 * root + 1
+            right = left + 1
+            if left < size and arr[lo + left] > arr[lo + largest]:
+                largest = left
+            if right < size and arr[lo + right] > arr[lo + largest]:
+                largest = right
+            if largest == root:
+                return
+            arr[lo + root], arr[lo + largest] = arr[lo + largest], arr[lo + root]
+            root = largest
@@ -1,13 +1,22 @@
 from algorithms.sort_strategy_interface import SortStrategy
 
 class MergeSort(SortStrategy):
+    def __init__(self, bottom_up=False):
+        self.bottom_up = bottom_up
+
     def sort(self, arr):
+        if self.bottom_up:
+            self.bottom_up_sort(arr)
+        else:
+            self.merge_sort(arr)
+
+    def merge_sort(self, arr):
         if len(arr) > 1:
             mid = len(arr) // 2
             L = arr[:mid]
             R = arr[mid:]
-            self.sort(L)
-            self.sort(R)
+            self.merge_sort(L)
+            self.merge_sort(R)
             i = j = k = 0
             while i < len(L) and j < len(R):
                 if L[i] < R[j]:
@@ -24,4 +33,44 @@ class MergeSort(SortStrategy):
             while j < len(R):
                 arr[k] = R[j]
                 j += 1
-                k += 1
\ No newline at end of file
+                k += 1
+
+    def bottom_up_sort(self, arr):
+        # Iterativo: um único buffer auxiliar de tamanho n, alternando origem e destino
+        n = len(arr)
+        src = arr
+        dst = arr[:]
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                if mid >= hi or src[mid - 1] <= src[mid]:
+                    # Par já em ordem: só copia para o buffer de destino
+                    dst[lo:hi] = src[lo:hi]
+                    continue
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    if src[j] < src[i]:
+                        dst[k] = src[j]
+                        j += 1
+                    else:
+                        dst[k] = src[i]
+                        i += 1
+                    k += 1
+                while i < mid:
+                    dst[k] = src[i]
+                    i += 1
+                    k += 1
+                while j < hi:
+                    dst[k] = src[j]
+                    j += 1
+                    k += 1
+            src, dst = dst, src
+            width *= 2
+        if src is not arr:
+            arr[:] = src
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import bottom_up_merge_sort
+        bottom_up_merge_sort(arr)
\ No newline at end of file
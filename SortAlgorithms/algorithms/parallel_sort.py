@@ -0,0 +1,199 @@
+import heapq
+import os
+import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from algorithms.sort_strategy_interface import SortStrategy
+from algorithms.buffer_backend import np
+from algorithms.tim_sort import TimSort
+
+# Listas vão para a memória compartilhada como int64 (ou float64, com numpy);
+# buffers numpy mantêm o próprio dtype
+TYPECODE = 'q'
+ITEM_SIZE = 8
+LIST_DTYPE = '<i8'
+FLOAT_DTYPE = '<f8'
+SHARED_KINDS = 'iuf'
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def _list_dtype(arr):
+    """dtype com que a lista cabe na memória compartilhada sem perdas, ou None."""
+    kinds = {type(value) for value in arr}
+    if kinds == {int}:
+        if INT64_MIN <= min(arr) and max(arr) <= INT64_MAX:
+            return LIST_DTYPE
+    elif kinds == {float} and np is not None:
+        return FLOAT_DTYPE
+    return None
+
+
+def _item_size(dtype):
+    return np.dtype(dtype).itemsize if np is not None else ITEM_SIZE
+
+
+def _attach(name, n, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:n * _item_size(dtype)]
+    if np is None:
+        view = view.cast(TYPECODE)
+    return shm, view
+
+
+def _sort_range(name, n, lo, hi, strategy, samples, dtype):
+    """Worker: ordena sua faixa direto na memória compartilhada e devolve amostras."""
+    shm, view = _attach(name, n, dtype)
+    try:
+        if np is not None:
+            local = np.ndarray(hi - lo, dtype=dtype, buffer=view, offset=lo * _item_size(dtype))
+            strategy.sort_buffer(local)
+            step = max(1, (hi - lo) // (samples + 1))
+            sample = local[step::step][:samples].tolist()
+            del local
+            return sample
+        else:
+            local = view[lo:hi].tolist()
+            strategy.sort(local)
+            view[lo:hi] = array(TYPECODE, local)
+        size = hi - lo
+        step = max(1, size // (samples + 1))
+        return [view[i] for i in range(lo + step, hi, step)][:samples]
+    finally:
+        view.release()
+        shm.close()
+
+
+def _merge_bucket(input_name, output_name, n, pieces, offset, dtype):
+    """Worker: intercala os pedaços de todas as faixas que caem no mesmo balde."""
+    shm_in, source = _attach(input_name, n, dtype)
+    shm_out, target = _attach(output_name, n, dtype)
+    try:
+        if np is not None:
+            # Copia os pedaços lado a lado; o timsort do numpy reconhece as runs e só intercala
+            src = np.ndarray(n, dtype=dtype, buffer=source)
+            total = sum(hi - lo for lo, hi in pieces)
+            out = np.ndarray(total, dtype=dtype, buffer=target, offset=offset * _item_size(dtype))
+            position = 0
+            for lo, hi in pieces:
+                out[position:position + hi - lo] = src[lo:hi]
+                position += hi - lo
+            out.sort(kind='stable')
+            del src, out
+        else:
+            k = offset
+            for value in heapq.merge(*(source[lo:hi] for lo, hi in pieces)):
+                target[k] = value
+                k += 1
+    finally:
+        source.release()
+        target.release()
+        shm_in.close()
+        shm_out.close()
+
+
+class ParallelSort(SortStrategy):
+    """Sample sort multi-processo: a entrada fica em shared_memory e só índices trafegam entre processos."""
+    # A memória compartilhada guarda números (int64 ou float64 para listas)
+    comparison_based = False
+
+    def __init__(self, workers=None, local_strategy=None, oversampling=32, min_size=50000):
+        self.workers = workers or os.cpu_count() or 1
+        self.local_strategy = local_strategy or TimSort()
+        self.oversampling = oversampling
+        self.min_size = min_size
+        self.last_timings = {}
+
+    def sort(self, arr):
+        self._sort(arr, buffer=False)
+
+    def sort_buffer(self, arr):
+        self._sort(arr, buffer=True)
+
+    def _sort(self, arr, buffer):
+        n = len(arr)
+        dtype = None
+        if n >= self.min_size and self.workers >= 2:
+            if buffer:
+                dtype = arr.dtype.str if arr.dtype.kind in SHARED_KINDS else None
+            else:
+                dtype = _list_dtype(arr)
+        if dtype is None:
+            # Abaixo do limite o custo de subir processos não compensa; tipos que não cabem
+            # na memória compartilhada (objetos, floats sem numpy, ints além de int64) também ficam locais
+            if buffer:
+                self.local_strategy.sort_buffer(arr)
+            else:
+                self.local_strategy.sort(arr)
+            return
+
+        timings = {}
+        start = time.perf_counter()
+        size = n * _item_size(dtype)
+        shm_in = shared_memory.SharedMemory(create=True, size=size)
+        shm_out = shared_memory.SharedMemory(create=True, size=size)
+        source = shm_in.buf[:size]
+        target = shm_out.buf[:size]
+        if np is not None:
+            source_array = np.ndarray(n, dtype=dtype, buffer=source)
+        else:
+            source = source.cast(TYPECODE)
+            target = target.cast(TYPECODE)
+        try:
+            if np is not None:
+                source_array[:] = arr
+            else:
+                source[:] = array(TYPECODE, arr)
+            bounds = [n * w // self.workers for w in range(self.workers + 1)]
+            ranges = list(zip(bounds, bounds[1:]))
+            timings['partition'] = time.perf_counter() - start
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                start = time.perf_counter()
+                sample_lists = executor.map(
+                    _sort_range,
+                    *zip(*[(shm_in.name, n, lo, hi, self.local_strategy, self.oversampling, dtype)
+                           for lo, hi in ranges])
+                )
+                samples = sorted(value for sample in sample_lists for value in sample)
+                timings['local_sort'] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                step = len(samples) / self.workers
+                splitters = [samples[int(step * b)] for b in range(1, self.workers)]
+                # cuts[r][b]: início do balde b dentro da faixa r já ordenada
+                if np is not None:
+                    cuts = [[lo] + (lo + np.searchsorted(source_array[lo:hi], np.asarray(splitters, dtype=dtype))).tolist() + [hi]
+                            for lo, hi in ranges]
+                else:
+                    cuts = [[lo] + [bisect_left(source, s, lo, hi) for s in splitters] + [hi]
+                            for lo, hi in ranges]
+                jobs = []
+                offset = 0
+                for b in range(self.workers):
+                    pieces = [(cut[b], cut[b + 1]) for cut in cuts if cut[b] < cut[b + 1]]
+                    jobs.append((shm_in.name, shm_out.name, n, pieces, offset, dtype))
+                    offset += sum(hi - lo for lo, hi in pieces)
+                list(executor.map(_merge_bucket, *zip(*jobs)))
+                timings['merge'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if np is not None:
+                result = np.ndarray(n, dtype=dtype, buffer=target)
+                arr[:] = result if buffer else result.tolist()
+                del result
+            else:
+                arr[:] = target.tolist()
+            timings['copy_back'] = time.perf_counter() - start
+        finally:
+            if np is not None:
+                del source_array
+            source.release()
+            target.release()
+            shm_in.close()
+            shm_out.close()
+            shm_in.unlink()
+            shm_out.unlink()
+        self.last_timings = timings
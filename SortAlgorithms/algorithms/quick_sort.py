@@ -1,11 +1,18 @@
 from algorithms.sort_strategy_interface import SortStrategy
 
 class QuickSort(SortStrategy):
+    def __init__(self, cutoff=0):
+        # Partições com até cutoff elementos vão para insertion sort (0 = quicksort puro)
+        self.cutoff = cutoff
+
     def sort(self, arr):
         self.quick_sort(arr, 0, len(arr) - 1)
     
     def quick_sort(self, arr, low, high):
         if low < high:
+            if high - low < self.cutoff:
+                self.insertion_sort(arr, low, high)
+                return
             pi = self.partition(arr, low, high)
             self.quick_sort(arr, low, pi - 1)
             self.quick_sort(arr, pi + 1, high)
@@ -18,4 +25,17 @@ class QuickSort(SortStrategy):
                 i += 1
                 arr[i], arr[j] = arr[j], arr[i]
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
\ No newline at end of file
+        return i + 1
+
+    def insertion_sort(self, arr, low, high):
+        for i in range(low + 1, high + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import quick_sort
+        quick_sort(arr)
\ No newline at end of file
@@ -1,26 +1,102 @@
 from algorithms.sort_strategy_interface import SortStrategy
 
+# Abaixo deste tamanho os baldes do MSD são ordenados diretamente
+MSD_CUTOFF = 64
+
 class RadixSort(SortStrategy):
+    """Radix sort de base 2^base_bits sobre (valor - mínimo), o que cobre negativos.
+
+    variant: 'lsd', 'msd' ou 'auto' (MSD quando a chave precisaria de mais de
+    max_lsd_passes passadas LSD). Passadas em que todos caem no mesmo balde são puladas.
+    """
+    comparison_based = False
+
+    def __init__(self, base_bits=8, variant='auto', max_lsd_passes=4):
+        if not 1 <= base_bits <= 16:
+            raise ValueError("base_bits deve ficar entre 1 e 16 (base 2^8 ou 2^16 são as usuais).")
+        if variant not in ('lsd', 'msd', 'auto'):
+            raise ValueError(f"Variante desconhecida: {variant}")
+        self.base_bits = base_bits
+        self.variant = variant
+        self.max_lsd_passes = max_lsd_passes
+
+    def passes(self, key_bits):
+        return -(-key_bits // self.base_bits)
+
+    def use_msd(self, key_bits):
+        if self.variant == 'auto':
+            return self.passes(key_bits) > self.max_lsd_passes
+        return self.variant == 'msd'
+
     def sort(self, arr):
-        max_num = max(arr)
-        exp = 1
-        while max_num // exp > 0:
-            self.counting_sort(arr, exp)
-            exp *= 10
-    
-    def counting_sort(self, arr, exp):
-        n = len(arr)
-        output = [0] * n
-        count = [0] * 10
-        for i in arr:
-            index = i // exp % 10
-            count[index] += 1
-        for i in range(1, 10):
-            count[i] += count[i - 1]
-        i = n - 1
-        while i >= 0:
-            index = arr[i] // exp % 10
-            output[count[index] - 1] = arr[i]
-            count[index] -= 1
-            i -= 1
-        arr[:] = output
\ No newline at end of file
+        if len(arr) < 2:
+            return
+        min_val = min(arr)
+        key_bits = (max(arr) - min_val).bit_length()
+        if key_bits == 0:
+            return
+        if self.use_msd(key_bits):
+            top_shift = (self.passes(key_bits) - 1) * self.base_bits
+            self.msd_sort(arr, 0, len(arr), top_shift, min_val)
+            return
+        for shift in range(0, key_bits, self.base_bits):
+            self.counting_sort(arr, shift, min_val)
+
+    def counting_sort(self, arr, shift, min_val):
+        """Passada estável pelo dígito em shift; devolve False se ela foi trivial (pulada)."""
+        mask = (1 << self.base_bits) - 1
+        digits = [((num - min_val) >> shift) & mask for num in arr]
+        count = [0] * (mask + 1)
+        for digit in digits:
+            count[digit] += 1
+        if count[digits[0]] == len(arr):
+            return False
+        total = 0
+        for i in range(mask + 1):
+            count[i], total = total, total + count[i]
+        output = [0] * len(arr)
+        for num, digit in zip(arr, digits):
+            output[count[digit]] = num
+            count[digit] += 1
+        arr[:] = output
+        return True
+
+    def msd_sort(self, arr, lo, hi, shift, min_val):
+        mask = (1 << self.base_bits) - 1
+        while True:
+            if hi - lo <= MSD_CUTOFF:
+                arr[lo:hi] = sorted(arr[lo:hi])
+                return
+            buckets = {}
+            for num in arr[lo:hi]:
+                buckets.setdefault(((num - min_val) >> shift) & mask, []).append(num)
+            if len(buckets) > 1 or shift == 0:
+                break
+            # Dígito igual para todos: desce para o próximo sem reescrever a faixa
+            shift -= self.base_bits
+        start = lo
+        for digit in sorted(buckets):
+            bucket = buckets[digit]
+            arr[start:start + len(bucket)] = bucket
+            if shift > 0 and len(bucket) > 1:
+                self.msd_sort(arr, start, start + len(bucket), max(0, shift - self.base_bits), min_val)
+            start += len(bucket)
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import np, offset_keys, require_integers
+        if len(arr) < 2:
+            return
+        require_integers(arr)
+        min_val = int(arr.min())
+        key_bits = (int(arr.max()) - min_val).bit_length()
+        # Chaves em uint64 com aritmética módulo 2^64: (valor - mínimo) nunca transborda
+        keys, offset = offset_keys(arr, min_val)
+        mask = np.uint64((1 << self.base_bits) - 1)
+        digit_type = np.uint8 if self.base_bits <= 8 else np.uint16
+        for shift in range(0, key_bits, self.base_bits):
+            # Passada por dígito: argsort estável sobre o dígito equivale ao counting sort
+            digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+            if digits.min() == digits.max():
+                continue
+            keys = keys[np.argsort(digits, kind="stable")]
+        arr[:] = (keys + offset).astype(arr.dtype)
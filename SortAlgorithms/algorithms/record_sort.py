@@ -0,0 +1,105 @@
+from operator import itemgetter
+from algorithms.buffer_backend import np
+
+# Dígitos de 8 bits na versão com listas; com numpy, 16 bits (o argsort estável do
+# numpy para uint16 já é um radix sort)
+LIST_RADIX_BITS = 8
+BUFFER_RADIX_BITS = 16
+MAX_KEY_BITS = 64
+
+
+def key_functions(key):
+    """Normaliza key em uma lista de funções, da chave primária para a secundária.
+
+    Aceita None (o próprio registro), um callable, um nome de campo (dicts, ex.: JSONL/CSV),
+    um índice (listas/tuplas) ou uma lista/tupla com qualquer combinação deles.
+    """
+    if key is None:
+        return [lambda record: record]
+    if isinstance(key, (list, tuple)):
+        return [function for part in key for function in key_functions(part)]
+    if callable(key):
+        return [key]
+    return [itemgetter(key)]
+
+
+def _bounded_integers(column):
+    if any(type(value) is not int for value in column):
+        return False
+    return not column or (max(column) - min(column)).bit_length() <= MAX_KEY_BITS
+
+
+def _radix_pass_list(order, values, bits):
+    mask = (1 << LIST_RADIX_BITS) - 1
+    for shift in range(0, bits, LIST_RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(values[i] >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+    return order
+
+
+def _radix_pass_buffer(order, values, bits):
+    values = np.array(values, dtype=np.uint64)[order]
+    mask = (1 << BUFFER_RADIX_BITS) - 1
+    for shift in range(0, bits, BUFFER_RADIX_BITS):
+        digits = ((values >> np.uint64(shift)) & np.uint64(mask)).astype(np.uint16)
+        permutation = digits.argsort(kind='stable')
+        order = order[permutation]
+        values = values[permutation]
+    return order
+
+
+def radix_argsort(columns, reverse=False):
+    """Permutação estável que ordena os índices por várias colunas de chaves inteiras.
+
+    LSD: cada coluna (da última para a primeira) é processada em passadas estáveis por
+    dígito, deslocada pelo mínimo para aceitar negativos; só os índices se movem.
+    Com reverse, a chave vira (máximo - chave), o que mantém a estabilidade.
+    """
+    n = len(columns[0]) if columns else 0
+    order = np.arange(n) if np is not None else list(range(n))
+    for column in reversed(columns):
+        low = min(column, default=0)
+        high = max(column, default=0)
+        bits = (high - low).bit_length()
+        if bits == 0:
+            continue  # coluna constante não altera a ordem
+        if reverse:
+            values = [high - value for value in column]
+        else:
+            values = [value - low for value in column]
+        if np is not None:
+            order = _radix_pass_buffer(order, values, bits)
+        else:
+            order = _radix_pass_list(order, values, bits)
+    return order.tolist() if np is not None else order
+
+
+def decorated_argsort(keys, reverse=False, strategy=None):
+    """Decorate-sort-undecorate sobre pares (chave, índice) já calculados.
+
+    O índice desempata, então até estratégias instáveis produzem ordem estável; no modo
+    reverse o índice entra negativo e a lista é invertida no final.
+    """
+    sign = -1 if reverse else 1
+    decorated = [(key, sign * i) for i, key in enumerate(keys)]
+    if strategy is not None and strategy.comparison_based:
+        strategy.sort(decorated)
+    else:
+        decorated.sort()
+    if reverse:
+        decorated.reverse()
+    return [sign * i for _, i in decorated]
+
+
+def sort_records(records, key=None, reverse=False, strategy=None):
+    """Ordena records in-place por key; cada chave é calculada uma única vez por registro."""
+    functions = key_functions(key)
+    columns = [[function(record) for record in records] for function in functions]
+    if all(_bounded_integers(column) for column in columns):
+        order = radix_argsort(columns, reverse)
+    else:
+        keys = columns[0] if len(columns) == 1 else list(zip(*columns))
+        order = decorated_argsort(keys, reverse, strategy)
+    records[:] = [records[i] for i in order]
@@ -0,0 +1,86 @@
+from importlib import import_module
+
+
+class StrategySpec:
+    """Declaração de uma estratégia: o módulo só é importado no primeiro uso.
+
+    complexity usa os nomes de curva do agendador de benchmark ('n', 'n log n', 'n^1.5', 'n^2');
+    supports_counting indica se há versão instrumentada (comparações/trocas) em sort_all.py.
+    """
+
+    def __init__(self, name, label, module, class_name, stable, in_place, complexity,
+                 supports_counting=False, kwargs=None):
+        self.name = name
+        self.label = label
+        self.module = module
+        self.class_name = class_name
+        self.stable = stable
+        self.in_place = in_place
+        self.complexity = complexity
+        self.supports_counting = supports_counting
+        self.kwargs = kwargs or {}
+        self._cls = None
+
+    def load(self):
+        if self._cls is None:
+            self._cls = getattr(import_module(f"algorithms.{self.module}"), self.class_name)
+        return self._cls
+
+    def create(self, **kwargs):
+        return self.load()(**dict(self.kwargs, **kwargs))
+
+
+# A ordem define a numeração do menu de main.py
+SPECS = [
+    StrategySpec('bubble_sort', 'BubbleSort', 'bubble_sort', 'BubbleSort',
+                 stable=True, in_place=True, complexity='n^2', supports_counting=True),
+    StrategySpec('bubble_sort_optimized', 'BubbleSortOptimized', 'bubble_sort_optimized', 'BubbleSortOptimized',
+                 stable=True, in_place=True, complexity='n^2'),
+    StrategySpec('insertion_sort', 'InsertionSort', 'insertion_sort', 'InsertionSort',
+                 stable=True, in_place=True, complexity='n^2', supports_counting=True),
+    StrategySpec('selection_sort', 'SelectionSort', 'selection_sort', 'SelectionSort',
+                 stable=False, in_place=True, complexity='n^2', supports_counting=True),
+    StrategySpec('quick_sort', 'QuickSort', 'quick_sort', 'QuickSort',
+                 stable=False, in_place=True, complexity='n log n', supports_counting=True),
+    StrategySpec('merge_sort', 'MergeSort', 'merge_sort', 'MergeSort',
+                 stable=True, in_place=False, complexity='n log n', supports_counting=True),
+    StrategySpec('heap_sort', 'HeapSort', 'heap_sort', 'HeapSort',
+                 stable=False, in_place=False, complexity='n log n', supports_counting=True),
+    StrategySpec('shell_sort', 'ShellSort', 'shell_sort', 'ShellSort',
+                 stable=False, in_place=True, complexity='n^1.5', supports_counting=True),
+    StrategySpec('counting_sort', 'CountingSort', 'counting_sort', 'CountingSort',
+                 stable=True, in_place=False, complexity='n', supports_counting=True),
+    StrategySpec('radix_sort', 'RadixSort', 'radix_sort', 'RadixSort',
+                 stable=True, in_place=False, complexity='n', supports_counting=True),
+    StrategySpec('tim_sort', 'TimSort', 'tim_sort', 'TimSort',
+                 stable=True, in_place=False, complexity='n log n', supports_counting=True),
+    StrategySpec('intro_sort', 'IntroSort', 'intro_sort', 'IntroSort',
+                 stable=False, in_place=True, complexity='n log n', supports_counting=True),
+    StrategySpec('auto_sort', 'AutoSort', 'auto_sort', 'AutoSort',
+                 stable=False, in_place=False, complexity='n log n'),
+    StrategySpec('parallel_sort', 'ParallelSort', 'parallel_sort', 'ParallelSort',
+                 stable=False, in_place=False, complexity='n log n'),
+    StrategySpec('merge_sort_bottom_up', 'MergeSortBottomUp', 'merge_sort', 'MergeSort',
+                 stable=True, in_place=False, complexity='n log n', supports_counting=True,
+                 kwargs={'bottom_up': True}),
+    StrategySpec('block_merge_sort', 'BlockMergeSort', 'block_merge_sort', 'BlockMergeSort',
+                 stable=True, in_place=True, complexity='n log n', supports_counting=True),
+]
+_BY_NAME = {spec.name: spec for spec in SPECS}
+_BY_LABEL = {spec.label: spec for spec in SPECS}
+
+
+def specs():
+    return list(SPECS)
+
+
+def get_spec(name):
+    """Busca pelo nome ('tim_sort') ou pelo rótulo usado nos benchmarks ('TimSort')."""
+    spec = _BY_NAME.get(name) or _BY_LABEL.get(name)
+    if spec is None:
+        raise KeyError(f"Método de ordenação desconhecido: {name}")
+    return spec
+
+
+def create_strategy(name, **kwargs):
+    return get_spec(name).create(**kwargs)
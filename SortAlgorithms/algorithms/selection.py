@@ -0,0 +1,98 @@
+import heapq
+from algorithms.quick_sort import QuickSort
+
+# Abaixo deste tamanho a faixa restante é simplesmente ordenada
+SMALL_RANGE = 16
+
+
+def _check_index(n, size):
+    if not 0 <= n < size:
+        raise IndexError(f"Posição {n} fora do intervalo [0, {size}).")
+
+
+def _as_buffer(arr):
+    # Listas, o caso comum, não chegam a importar o backend de buffer (numpy)
+    if isinstance(arr, list):
+        return None
+    from algorithms.buffer_backend import as_array, is_buffer
+    return as_array(arr) if is_buffer(arr) else None
+
+
+def _median_of_three_to_end(arr, low, high):
+    # Leva a mediana de (low, mid, high) para arr[high], onde QuickSort.partition busca o pivô
+    mid = (low + high) // 2
+    if arr[mid] < arr[low]:
+        arr[mid], arr[low] = arr[low], arr[mid]
+    if arr[high] < arr[low]:
+        arr[high], arr[low] = arr[low], arr[high]
+    if arr[mid] < arr[high]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+
+
+def nth_element(arr, n, partitioner=None):
+    """Introselect: coloca em arr[n] o valor que ocuparia essa posição na ordem,
+    com os menores (ou iguais) antes e os maiores (ou iguais) depois.
+
+    Usa a partição de QuickSort com pivô mediana-de-três; se a recursão passar de
+    2*log2(n) níveis (ex.: muitas repetições), a faixa restante é ordenada por heap.
+    """
+    _check_index(n, len(arr))
+    buf = _as_buffer(arr)
+    if buf is not None:
+        buf.partition(n)
+        return buf[n]
+    partitioner = partitioner or QuickSort()
+    low, high = 0, len(arr) - 1
+    depth = 2 * max(1, len(arr).bit_length())
+    while high - low > SMALL_RANGE:
+        if depth == 0:
+            heap = arr[low:high + 1]
+            heapq.heapify(heap)
+            arr[low:high + 1] = [heapq.heappop(heap) for _ in range(len(heap))]
+            return arr[n]
+        depth -= 1
+        _median_of_three_to_end(arr, low, high)
+        pivot = partitioner.partition(arr, low, high)
+        if pivot == n:
+            return arr[n]
+        if n < pivot:
+            high = pivot - 1
+        else:
+            low = pivot + 1
+    arr[low:high + 1] = sorted(arr[low:high + 1])
+    return arr[n]
+
+
+def partial_sort(arr, k):
+    """Ordena só as k primeiras posições (os k menores valores); o resto fica em ordem arbitrária."""
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    buf = _as_buffer(arr)
+    if buf is not None:
+        if k < len(buf):
+            buf.partition(k - 1)
+        buf[:k].sort()
+        return
+    if k < len(arr):
+        nth_element(arr, k - 1)
+    arr[:k] = sorted(arr[:k])
+
+
+def top_k(iterable, k, largest=False):
+    """k menores (ou maiores) valores em ordem, com um heap de tamanho k: O(n log k)
+    de tempo e O(k) de memória, consumindo o iterável uma única vez.
+    """
+    if k <= 0:
+        return []
+    if largest:
+        return heapq.nlargest(k, iterable)
+    return heapq.nsmallest(k, iterable)
+
+
+def top_k_file(path, k, largest=False):
+    """Top-k de um arquivo de números sem carregá-lo inteiro na memória."""
+    # Import tardio: external_sort (fora do pacote algorithms) carrega o backend de buffer (numpy)
+    # e o sort_context, que só top_k_file precisa
+    from external_sort import iter_numbers
+    return top_k(iter_numbers(path), k, largest)
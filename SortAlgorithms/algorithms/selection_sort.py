@@ -7,4 +7,9 @@ class SelectionSort(SortStrategy):
             for j in range(i+1, len(arr)):
                 if arr[j] < arr[min_idx]:
                     min_idx = j
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+
+    def sort_buffer(self, arr):
+        for i in range(len(arr) - 1):
+            min_idx = i + int(arr[i:].argmin())
             arr[i], arr[min_idx] = arr[min_idx], arr[i]
\ No newline at end of file
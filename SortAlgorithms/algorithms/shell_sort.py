@@ -1,10 +1,65 @@
 from algorithms.sort_strategy_interface import SortStrategy
 
+
+# Sequências de gaps, do maior para o menor (sempre terminam em 1 quando n > 1)
+def shell_gaps(n):
+    # Original de Shell: n/2, n/4, ..., 1
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps
+
+
+def ciura_gaps(n):
+    # Valores empíricos de Ciura (2001), estendidos por 2,25x
+    seq = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while seq[-1] < n:
+        seq.append(int(seq[-1] * 2.25))
+    return [gap for gap in reversed(seq) if gap < n]
+
+
+def sedgewick_gaps(n):
+    # Sedgewick (1986): 4^k + 3·2^(k-1) + 1, precedida de 1
+    seq = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        seq.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return [gap for gap in reversed(seq) if gap < n]
+
+
+def tokuda_gaps(n):
+    # Tokuda (1992): teto((9^k - 4^k) / (5·4^(k-1)))
+    seq = []
+    k = 1
+    while True:
+        gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        if gap >= n:
+            break
+        seq.append(gap)
+        k += 1
+    return seq[::-1]
+
+
+GAP_SEQUENCES = {
+    'shell': shell_gaps,
+    'ciura': ciura_gaps,
+    'sedgewick': sedgewick_gaps,
+    'tokuda': tokuda_gaps,
+}
+
+
 class ShellSort(SortStrategy):
+    def __init__(self, gaps='shell'):
+        if gaps not in GAP_SEQUENCES:
+            raise ValueError(f"Sequência de gaps desconhecida: {gaps} (opções: {', '.join(GAP_SEQUENCES)})")
+        self.gaps = gaps
+
     def sort(self, arr):
         n = len(arr)
-        gap = n // 2
-        while gap > 0:
+        for gap in GAP_SEQUENCES[self.gaps](n):
             for i in range(gap, n):
                 temp = arr[i]
                 j = i
@@ -12,4 +67,16 @@ class ShellSort(SortStrategy):
                     arr[j] = arr[j - gap]
                     j -= gap
                 arr[j] = temp
-            gap //= 2
\ No newline at end of file
+
+    def sort_buffer(self, arr):
+        from algorithms.buffer_backend import np
+        n = len(arr)
+        for gap in GAP_SEQUENCES[self.gaps](n):
+            # As cadeias arr[r::gap] viram colunas de uma matriz, ordenadas todas juntas
+            rows = -(-n // gap)
+            grid = np.empty(rows * gap, dtype=arr.dtype)
+            grid[:n] = arr
+            grid[n:] = arr.max()
+            grid = grid.reshape(rows, gap)
+            grid.sort(axis=0)
+            arr[:] = grid.reshape(-1)[:n]
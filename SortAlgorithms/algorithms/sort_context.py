@@ -1,8 +1,61 @@
 from algorithms.sort_strategy_interface import SortStrategy
+from algorithms.tuning import load_profile
+
+
+def _is_buffer(arr):
+    # Listas, o caso comum, são reconhecidas sem importar o backend de buffer (numpy)
+    if isinstance(arr, list):
+        return False
+    from algorithms.buffer_backend import is_buffer
+    return is_buffer(arr)
+
 
 class SortContext:
-    def __init__(self, strategy: SortStrategy):
+    def __init__(self, strategy: SortStrategy, tuning=True):
+        # 'auto' escolhe a estratégia a cada execução a partir de um perfil da entrada
+        if strategy == 'auto':
+            from algorithms.auto_sort import AutoSort
+            strategy = AutoSort()
         self.strategy = strategy
+        # tuning: True usa o perfil desta máquina gerado por autotune.py (se existir),
+        # False mantém os padrões, ou um TuningProfile explícito
+        self.tuning = load_profile() if tuning is True else (tuning or None)
+
+    def tuned_strategy(self, arr, backend='list', distribution=None):
+        # backend: 'list' para sort/sort_records, 'buffer' para sort_buffer;
+        # sem distribution, o perfil a estima a partir de arr quando isso muda os parâmetros
+        if self.tuning is None:
+            return self.strategy
+        return self.tuning.apply(self.strategy, len(arr), distribution, backend, sample=arr)
     
-    def execute_sort(self, arr):
-        self.strategy.sort(arr)
\ No newline at end of file
+    def execute_sort(self, arr, key=None, reverse=False, distribution=None):
+        # Buffers (array.array, numpy.ndarray, memoryview) são ordenados in-place,
+        # sem cópia para lista; listas continuam usando a implementação de referência.
+        # distribution: nome de distributions.py, quando o chamador conhece a forma da entrada
+        if _is_buffer(arr):
+            if key is not None:
+                raise TypeError("key só é suportado em listas de registros.")
+            from algorithms.buffer_backend import as_array
+            buf = as_array(arr)
+            self.tuned_strategy(buf, 'buffer', distribution).sort_buffer(buf)
+            if reverse:
+                buf[:] = buf[::-1].copy()
+        elif key is not None or reverse:
+            # Registros: a amostra veria dicionários, não as chaves
+            self.tuned_strategy(arr, distribution=distribution or 'uniform').sort_records(arr, key, reverse)
+        else:
+            self.tuned_strategy(arr, distribution=distribution).sort(arr)
+
+    def execute_nth_element(self, arr, n):
+        """Seleção sem ordenação completa: O(n) em média."""
+        from algorithms.selection import nth_element
+        return nth_element(arr, n)
+
+    def execute_partial_sort(self, arr, k):
+        from algorithms.selection import partial_sort
+        partial_sort(arr, k)
+
+    def execute_top_k(self, iterable, k, largest=False):
+        """Aceita qualquer iterável, inclusive geradores de arquivos maiores que a memória."""
+        from algorithms.selection import top_k
+        return top_k(iterable, k, largest)
\ No newline at end of file
@@ -2,6 +2,22 @@ from abc import ABC, abstractmethod
 
 class SortStrategy(ABC):
     """Interface para estratégias de ordenação."""
+    # Estratégias que só comparam itens com < também ordenam tuplas (chave, índice)
+    comparison_based = True
+
     @abstractmethod
     def sort(self, arr):
-        pass
\ No newline at end of file
+        pass
+
+    def sort_buffer(self, arr):
+        """Ordena in-place um ndarray 1-D (backend de buffer); por padrão usa a ordenação do numpy."""
+        arr.sort(kind="stable")
+
+    def sort_records(self, records, key=None, reverse=False):
+        """Ordena registros por key (campo, índice, callable ou lista deles), de forma estável.
+
+        Chaves inteiras usam radix LSD sobre índices; as demais, decorate-sort-undecorate
+        com esta estratégia.
+        """
+        from algorithms.record_sort import sort_records
+        sort_records(records, key, reverse, strategy=self)
\ No newline at end of file
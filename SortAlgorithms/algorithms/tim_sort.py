@@ -2,4 +2,7 @@ from algorithms.sort_strategy_interface import SortStrategy
 
 class TimSort(SortStrategy):
     def sort(self, arr):
-        arr.sort()
\ No newline at end of file
+        arr.sort()
+
+    def sort_buffer(self, arr):
+        arr.sort(kind="stable")
\ No newline at end of file
@@ -0,0 +1,206 @@
+import math
+import os
+import time
+
+# json, inspect, copy e platform só são importados quando há perfil: SortContext
+# importa este módulo e não deve pesar em quem só ordena listas
+
+PROFILE_ENV = 'SORT_TUNING_PROFILE'
+# Ancorado no pacote (como auto_sort.THRESHOLDS_FILE): autotune.py e quem usa SortContext
+# encontram o mesmo arquivo qualquer que seja o diretório atual
+DEFAULT_PROFILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'results', 'tuning_profile.json'
+)
+
+_loaded = {}
+_defaults = {}
+
+
+def profile_path():
+    return os.environ.get(PROFILE_ENV, DEFAULT_PROFILE)
+
+
+def _cpu_model():
+    # platform.processor() costuma vir vazio no Linux; o modelo está em /proc/cpuinfo
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    import platform
+    return platform.processor()
+
+
+def machine_info():
+    import platform
+    return {
+        'machine': platform.machine(),
+        'cpu': _cpu_model(),
+        'cpus': os.cpu_count(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def machine_id():
+    # Hardware e versão do Python, sem o hostname: containers e CI trocam de nome a cada
+    # execução, mas a mesma geração de máquina reaproveita o perfil
+    info = machine_info()
+    return f"{info['machine']}/{info['cpu']}/{info['cpus']} cpus/{info['python']}"
+
+
+def guess_distribution(arr):
+    """Nome da distribuição de distributions.py que mais se parece com a entrada (por amostragem).
+
+    Reconhece só as que o perfil amostral distingue bem; o resto conta como 'uniform'.
+    """
+    from algorithms.auto_sort import profile_data
+    profile = profile_data(arr)
+    if profile.size < 2:
+        return 'uniform'
+    if profile.descent_ratio >= 0.95:
+        return 'reversed'
+    if profile.descent_ratio == 0:
+        return 'sorted'
+    if profile.descent_ratio <= 0.05:
+        return 'nearly_sorted'
+    if profile.duplicate_ratio >= 0.9:
+        return 'few_unique'
+    if profile.duplicate_ratio >= 0.5:
+        return 'zipf'
+    if profile.integers and profile.value_range > 2 ** 40:
+        return 'wide_range'
+    return 'uniform'
+
+
+def default_params(cls):
+    """Valores padrão do construtor de uma estratégia."""
+    defaults = _defaults.get(cls)
+    if defaults is None:
+        import inspect
+        defaults = _defaults[cls] = {
+            name: param.default for name, param in inspect.signature(cls.__init__).parameters.items()
+            if param.default is not inspect.Parameter.empty
+        }
+    return defaults
+
+
+class TuningProfile:
+    """Melhores parâmetros medidos nesta máquina, por estratégia, backend, tamanho e distribuição.
+
+    entries: {nome da classe: [{'size', 'distribution', 'backend', 'params', 'seconds', 'default_seconds'}]}.
+    backend é 'list' (sort) ou 'buffer' (sort_buffer); cada entrada só vale para o seu.
+    """
+
+    def __init__(self, entries=None, machine=None, created=None):
+        self.entries = entries or {}
+        self.machine = machine or machine_info()
+        self.created = created
+
+    def add(self, class_name, size, distribution, params, seconds, default_seconds=None, backend='list'):
+        entries = [entry for entry in self.entries.get(class_name, [])
+                   if (entry['size'], entry['distribution'], entry.get('backend', 'list'))
+                   != (size, distribution, backend)]
+        entries.append({'size': size, 'distribution': distribution, 'backend': backend, 'params': params,
+                        'seconds': seconds, 'default_seconds': default_seconds})
+        self.entries[class_name] = sorted(
+            entries, key=lambda entry: (entry.get('backend', 'list'), entry['distribution'], entry['size'])
+        )
+
+    def distributions(self, class_name, backend='list'):
+        return {entry['distribution'] for entry in self.entries.get(class_name, [])
+                if entry.get('backend', 'list') == backend}
+
+    def params_for(self, class_name, size, distribution=None, backend='list'):
+        """Parâmetros da entrada de tamanho mais próximo (em escala log); {} se não houver."""
+        entries = [entry for entry in self.entries.get(class_name, [])
+                   if entry.get('backend', 'list') == backend]
+        if not entries:
+            return {}
+        for wanted in (distribution, 'uniform'):
+            matching = [entry for entry in entries if entry['distribution'] == wanted]
+            if matching:
+                entries = matching
+                break
+        log_size = math.log(max(size, 1))
+        best = min(entries, key=lambda entry: abs(math.log(max(entry['size'], 1)) - log_size))
+        return best['params']
+
+    def apply(self, strategy, size, distribution=None, backend='list', sample=None):
+        """Cópia da estratégia com os parâmetros ajustados; parâmetros já alterados pelo
+        chamador (diferentes do padrão do construtor) são mantidos.
+
+        sample: a própria entrada; sem distribution, ela é estimada a partir dela quando o
+        perfil tem medições de mais de uma distribuição para a estratégia.
+        """
+        class_name = type(strategy).__name__
+        if distribution is None and sample is not None and len(self.distributions(class_name, backend)) > 1:
+            distribution = guess_distribution(sample)
+        params = self.params_for(class_name, size, distribution, backend)
+        if not params:
+            return strategy
+        defaults = default_params(type(strategy))
+        changes = {
+            name: value for name, value in params.items()
+            if name in defaults and getattr(strategy, name, None) == defaults[name] and value != defaults[name]
+        }
+        if not changes:
+            return strategy
+        import copy
+        tuned = copy.copy(strategy)
+        for name, value in changes.items():
+            setattr(tuned, name, value)
+        return tuned
+
+    def save(self, path=None):
+        """Grava o perfil na seção desta máquina, preservando as das outras."""
+        import json
+        path = path or profile_path()
+        try:
+            with open(path, 'r') as f:
+                document = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            document = {}
+        machines = document.setdefault('machines', {})
+        machines[machine_id()] = {
+            'machine': self.machine,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'entries': self.entries,
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(document, f, indent=2)
+        os.replace(tmp_path, path)
+        _loaded.pop(path, None)
+
+    @classmethod
+    def load(cls, path=None, machine=None):
+        """Perfil desta máquina (ou de machine), ou None se ainda não foi ajustada."""
+        import json
+        path = path or profile_path()
+        try:
+            with open(path, 'r') as f:
+                document = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        section = document.get('machines', {}).get(machine or machine_id())
+        if section is None:
+            return None
+        return cls(section.get('entries'), section.get('machine'), section.get('created'))
+
+
+def load_profile(path=None):
+    """Como TuningProfile.load, mas relê o arquivo só quando ele muda."""
+    path = path or profile_path()
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _loaded[path] = (mtime, TuningProfile.load(path))
+    return cached[1]
@@ -0,0 +1,143 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from itertools import product
+from algorithms.registry import get_spec
+from algorithms.shell_sort import GAP_SEQUENCES
+from algorithms.tuning import TuningProfile, default_params, profile_path
+from distributions import DISTRIBUTIONS, generate_distribution
+
+# Parâmetros ajustáveis de cada estratégia e os valores testados, por backend
+SEARCH_SPACE = {
+    'shell_sort': {'gaps': list(GAP_SEQUENCES)},
+    'quick_sort': {'cutoff': [0, 8, 16, 24, 32, 48, 64]},
+    'intro_sort': {'cutoff': [8, 12, 16, 24, 32, 48]},
+    'radix_sort': {'base_bits': [4, 6, 8, 11, 16]},
+    'block_merge_sort': {'run_size': [8, 16, 32, 64]},
+}
+# No sort_buffer só estes parâmetros têm efeito (os demais usam rotinas do numpy)
+BUFFER_SEARCH_SPACE = {
+    'shell_sort': {'gaps': list(GAP_SEQUENCES)},
+    'radix_sort': {'base_bits': [4, 6, 8, 11, 16]},
+}
+# Versões de sort_all.py (sort_timed); o minrun só existe no TimSort de lá, o do pacote usa list.sort
+BENCHMARK_SEARCH_SPACE = {
+    'tim_sort': {'minrun': [8, 16, 32, 48, 64, 128]},
+}
+BACKENDS = {'list': SEARCH_SPACE, 'buffer': BUFFER_SEARCH_SPACE, 'benchmark': BENCHMARK_SEARCH_SPACE}
+ALGORITHMS = list(dict.fromkeys(name for space in BACKENDS.values() for name in space))
+
+
+def benchmark_class(spec):
+    # sort_all.py fica na raiz do repositório, um nível acima deste diretório
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    import sort_all
+    return getattr(sort_all, spec.class_name)
+
+
+def candidates(space):
+    names = list(space)
+    return [dict(zip(names, values)) for values in product(*space.values())]
+
+
+def tune(name, size, distribution='uniform', repetitions=5, seed=0, backend='list'):
+    """Mede todas as combinações do espaço da estratégia e devolve a mais rápida (mediana).
+
+    backend 'list' cronometra sort sobre listas; 'buffer', sort_buffer sobre ndarrays;
+    'benchmark', sort_timed das versões de sort_all.py.
+    As repetições são intercaladas entre candidatos para que variações da máquina ao longo
+    da execução afetem todos igualmente. Retorna None se nenhum candidato terminou.
+    """
+    spec = get_spec(name)
+    options = candidates(BACKENDS[backend][spec.name])
+    data = generate_distribution(distribution, size, seed=seed)
+    if backend == 'buffer':
+        from algorithms.buffer_backend import np
+        data = np.array(data, dtype=np.int64)
+    cls = benchmark_class(spec) if backend == 'benchmark' else spec.load()
+    times = [[] for _ in options]
+    failed = set()
+    for _ in range(repetitions):
+        for index, params in enumerate(options):
+            if index in failed:
+                continue
+            strategy = cls(**dict(spec.kwargs, **params))
+            if backend == 'buffer':
+                arr, sort = data.copy(), strategy.sort_buffer
+            elif backend == 'benchmark':
+                # sort_timed já trabalha sobre uma cópia
+                arr, sort = data, strategy.sort_timed
+            else:
+                arr, sort = list(data), strategy.sort
+            start = time.perf_counter()
+            try:
+                sort(arr)
+            except (RecursionError, MemoryError):
+                # Ex.: QuickSort sem pivô aleatório em entrada ordenada
+                failed.add(index)
+                continue
+            times[index].append(time.perf_counter() - start)
+    medians = {index: statistics.median(times[index]) for index in range(len(options))
+               if index not in failed and times[index]}
+    if not medians:
+        return None
+    best = min(medians, key=medians.get)
+    defaults = default_params(cls)
+    default_index = next((index for index, params in enumerate(options)
+                          if all(defaults.get(key) == value for key, value in params.items())), None)
+    return {
+        'params': options[best],
+        'seconds': medians[best],
+        'default_seconds': medians.get(default_index),
+    }
+
+
+def autotune(names, sizes, distributions, repetitions=5, seed=0, profile=None, backends=('list',)):
+    profile = profile or TuningProfile()
+    for backend in backends:
+        for name in names:
+            spec = get_spec(name)
+            if spec.name not in BACKENDS[backend]:
+                continue
+            for distribution in distributions:
+                for size in sizes:
+                    result = tune(spec.name, size, distribution, repetitions, seed, backend)
+                    where = f"{spec.label} ({backend}) [{distribution}] n={size}"
+                    if result is None:
+                        print(f"{where}: nenhum candidato terminou")
+                        continue
+                    profile.add(spec.class_name, size, distribution, result['params'],
+                                result['seconds'], result['default_seconds'], backend)
+                    gain = ""
+                    if result['default_seconds']:
+                        gain = f" ({result['default_seconds'] / result['seconds']:.2f}x sobre o padrão)"
+                    print(f"{where}: {result['params']} {result['seconds'] * 1000:.2f} ms{gain}")
+    return profile
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ajusta parâmetros das estratégias para esta máquina.")
+    parser.add_argument('--algorithms', nargs='+', default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000])
+    parser.add_argument('--distributions', nargs='+', default=['uniform'], choices=list(DISTRIBUTIONS))
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profile', default=None, help=f"arquivo do perfil (padrão: {profile_path()})")
+    parser.add_argument('--backends', nargs='+', default=None, choices=list(BACKENDS),
+                        help="padrão: list e benchmark, e buffer quando o numpy está instalado")
+    parser.add_argument('--fresh', action='store_true', help="descarta o perfil atual desta máquina")
+    args = parser.parse_args()
+
+    backends = args.backends
+    if backends is None:
+        from algorithms.buffer_backend import np
+        backends = ['list', 'benchmark'] if np is None else ['list', 'buffer', 'benchmark']
+    current = None if args.fresh else TuningProfile.load(args.profile)
+    profile = autotune(args.algorithms, args.sizes, args.distributions, args.repetitions, args.seed, current,
+                       backends)
+    profile.save(args.profile)
+    print(f"Perfil salvo em {args.profile or profile_path()}; SortContext e sort_all.py passam a usá-lo automaticamente.")
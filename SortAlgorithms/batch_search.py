@@ -0,0 +1,152 @@
+from bisect import bisect_left, bisect_right
+from algorithms.buffer_backend import np, is_buffer
+from external_sort import iter_numbers
+
+
+class BatchSearchResult:
+    def __init__(self, indices, lower, upper):
+        self.indices = indices  # posição de uma ocorrência do alvo, ou -1
+        self.lower = lower      # primeiro índice com valor >= alvo
+        self.upper = upper      # primeiro índice com valor > alvo
+
+
+def load_sorted(path):
+    """Carrega um resultado ordenado (ex.: results/<metodo>.csv) em ndarray, ou lista sem numpy."""
+    if np is not None:
+        return np.fromiter(iter_numbers(path), dtype=np.int64)
+    return list(iter_numbers(path))
+
+
+def _is_sorted(values):
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+
+def _sweep_bounds(arr, targets):
+    # Alvos já ordenados: os dois ponteiros só andam para frente, O(n + m) no total
+    lower = []
+    upper = []
+    n = len(arr)
+    i = j = 0
+    for target in targets:
+        while i < n and arr[i] < target:
+            i += 1
+        if j < i:
+            j = i
+        while j < n and arr[j] <= target:
+            j += 1
+        lower.append(i)
+        upper.append(j)
+    return lower, upper
+
+
+def batch_bounds(arr, targets):
+    """Retorna (lower, upper) de todos os alvos de uma vez."""
+    if np is not None and is_buffer(arr):
+        values = np.asarray(arr)
+        queries = np.asarray(targets)
+        return (np.searchsorted(values, queries, side='left'),
+                np.searchsorted(values, queries, side='right'))
+    targets = list(targets)
+    n = len(arr)
+    m = len(targets)
+    # A varredura só compensa quando m * log2(n) supera n + m
+    if m and m * max(1, n.bit_length()) > n + m and _is_sorted(targets):
+        return _sweep_bounds(arr, targets)
+    return ([bisect_left(arr, t) for t in targets],
+            [bisect_right(arr, t) for t in targets])
+
+
+def batch_search(arr, targets):
+    lower, upper = batch_bounds(arr, targets)
+    if np is not None and isinstance(lower, np.ndarray):
+        indices = np.where(lower < upper, lower, -1)
+    else:
+        indices = [lo if lo < hi else -1 for lo, hi in zip(lower, upper)]
+    return BatchSearchResult(indices, lower, upper)
+
+
+def count_range(arr, lows, highs):
+    """Quantos valores caem em [low, high] para cada par (low, high)."""
+    lower, _ = batch_bounds(arr, lows)
+    _, upper = batch_bounds(arr, highs)
+    if np is not None and isinstance(lower, np.ndarray):
+        return np.maximum(upper - lower, 0)
+    return [max(hi - lo, 0) for lo, hi in zip(lower, upper)]
+
+
+class EytzingerIndex:
+    """Array ordenado em ordem de BFS (layout de Eytzinger) para buscas com poucos desvios.
+
+    A árvore é completa: as posições que sobram são preenchidas com um sentinela
+    maior que qualquer valor, o que deixa o laço de busca com número fixo de passos.
+    """
+
+    def __init__(self, sorted_arr):
+        self.n = len(sorted_arr)
+        self.depth = max(self.n, 1).bit_length()
+        self.size = (1 << self.depth) - 1
+        if np is not None and is_buffer(sorted_arr):
+            values = np.asarray(sorted_arr)
+            sentinel = np.iinfo(values.dtype).max if values.dtype.kind in 'iu' else np.inf
+            padded = np.full(self.size, sentinel, dtype=values.dtype)
+            padded[:self.n] = values
+            self.rank = self._ranks_numpy()
+            self.layout = np.empty(self.size + 1, dtype=values.dtype)
+            self.layout[0] = sentinel
+            self.layout[1:] = padded[self.rank[1:]]
+        else:
+            padded = list(sorted_arr) + [float('inf')] * (self.size - self.n)
+            self.rank = [self._rank(k) for k in range(self.size + 1)]
+            self.layout = [padded[min(r, self.size - 1)] for r in self.rank]
+
+    def _rank(self, k):
+        # Posição em ordem (in-order) do nó k numa árvore completa de profundidade depth
+        if k == 0:
+            return self.n
+        level = k.bit_length() - 1
+        offset = k - (1 << level)
+        return ((2 * offset + 1) << (self.depth - 1 - level)) - 1
+
+    def _ranks_numpy(self):
+        k = np.arange(self.size + 1, dtype=np.int64)
+        k[0] = 1
+        level = np.floor(np.log2(k)).astype(np.int64)
+        offset = k - (1 << level)
+        ranks = ((2 * offset + 1) << (self.depth - 1 - level)) - 1
+        ranks[0] = self.n
+        return ranks
+
+    def _descend(self, x, strict):
+        layout = self.layout
+        k = 1
+        while k <= self.size:
+            k = 2 * k + bool(layout[k] < x if strict else layout[k] <= x)
+        # Volta ao último nó em que a busca desceu para a esquerda
+        k >>= ((k + 1) & ~k).bit_length()
+        return min(self.rank[k], self.n) if k else self.n
+
+    def lower_bound(self, x):
+        return self._descend(x, strict=True)
+
+    def upper_bound(self, x):
+        return self._descend(x, strict=False)
+
+    def count_range(self, low, high):
+        return max(self.upper_bound(high) - self.lower_bound(low), 0)
+
+    def batch_bounds(self, targets):
+        """Versão vetorizada: todos os alvos descem a árvore juntos, nível a nível."""
+        if np is None or not isinstance(self.layout, np.ndarray):
+            return ([self.lower_bound(t) for t in targets],
+                    [self.upper_bound(t) for t in targets])
+        queries = np.asarray(targets)
+        return self._descend_numpy(queries, strict=True), self._descend_numpy(queries, strict=False)
+
+    def _descend_numpy(self, queries, strict):
+        k = np.ones(len(queries), dtype=np.int64)
+        for _ in range(self.depth):
+            node = self.layout[k]
+            k = 2 * k + ((node < queries) if strict else (node <= queries))
+        lowest_zero = (k + 1) & ~k
+        k = k // (2 * lowest_zero)
+        return np.minimum(self.rank[k], self.n)
@@ -0,0 +1,130 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from algorithms.buffer_backend import np
+from external_sort import iter_numbers
+
+# Cabeçalho de 16 bytes: magic, versão, typecode do array, 2 bytes reservados e
+# quantidade de números; em seguida os inteiros de 64 bits em little-endian
+MAGIC = b'SRTN'
+VERSION = 1
+TYPECODE = 'q'
+HEADER = struct.Struct('<4sBc2xQ')
+WRITE_BLOCK = 1 << 16
+BINARY_EXTENSIONS = ('.bin', '.npy')
+
+
+def is_binary_path(path):
+    return path.lower().endswith(BINARY_EXTENSIONS)
+
+
+def _to_little_endian(block):
+    if sys.byteorder == 'big':
+        block.byteswap()
+    return block
+
+
+def write_binary(path, numbers):
+    """Grava números no formato binário; aceita lista, array.array, ndarray ou memoryview."""
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, TYPECODE.encode(), len(numbers)))
+        if np is not None and not isinstance(numbers, list):
+            np.asarray(numbers).astype('<i8', copy=False).tofile(f)
+            return
+        for start in range(0, len(numbers), WRITE_BLOCK):
+            _to_little_endian(array(TYPECODE, numbers[start:start + WRITE_BLOCK])).tofile(f)
+
+
+def read_header(f):
+    magic, version, typecode, count = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Arquivo não está no formato binário de números.")
+    if version != VERSION or typecode.decode() != TYPECODE:
+        raise ValueError(f"Versão {version} / tipo {typecode!r} não suportados.")
+    return count
+
+
+def read_binary(path, mode='c'):
+    """Mapeia o arquivo em memória e devolve um memoryview de int64, sem copiar os dados.
+
+    mode: 'r' somente leitura, 'r+' grava as alterações no arquivo,
+    'c' cópia privada (copy-on-write), que permite ordenar sem tocar no arquivo.
+    """
+    access = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}[mode]
+    # ACCESS_COPY nunca grava no arquivo: só 'r+' precisa abri-lo para escrita
+    with open(path, 'r+b' if mode == 'r+' else 'rb') as f:
+        count = read_header(f)
+        if count == 0:
+            return memoryview(array(TYPECODE))
+        mapped = mmap.mmap(f.fileno(), 0, access=access)
+    view = memoryview(mapped)[HEADER.size:HEADER.size + count * 8].cast(TYPECODE)
+    if sys.byteorder == 'big':
+        return memoryview(_to_little_endian(array(TYPECODE, view)))
+    return view
+
+
+def read_dataset(path, mode='c'):
+    """Lê .bin/.npy via mmap ou arquivos de texto (CSV ou um número por linha)."""
+    if path.lower().endswith('.npy'):
+        if np is None:
+            raise RuntimeError("Arquivos .npy requerem numpy instalado.")
+        return np.load(path, mmap_mode=mode)
+    if path.lower().endswith('.bin'):
+        return read_binary(path, mode)
+    return array(TYPECODE, iter_numbers(path))
+
+
+def write_dataset(path, numbers, delimiter=None):
+    if path.lower().endswith('.npy'):
+        if np is None:
+            raise RuntimeError("Arquivos .npy requerem numpy instalado.")
+        np.save(path, np.asarray(numbers, dtype=np.int64))
+    elif path.lower().endswith('.bin'):
+        write_binary(path, numbers)
+    else:
+        # CSV de uma linha, como save_numbers; demais extensões, um número por linha
+        if delimiter is None:
+            delimiter = ',' if path.lower().endswith('.csv') else '\n'
+        with open(path, 'w', newline='') as f:
+            for start in range(0, len(numbers), WRITE_BLOCK):
+                if start:
+                    f.write(delimiter)
+                f.write(delimiter.join(map(str, numbers[start:start + WRITE_BLOCK])))
+            if delimiter == ',':
+                f.write('\r\n')
+
+
+def convert(source, target):
+    """Converte entre texto, .bin e .npy; texto para .bin é feito em streaming."""
+    if target.lower().endswith('.bin') and not is_binary_path(source):
+        count = 0
+        with open(target, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, TYPECODE.encode(), 0))
+            block = array(TYPECODE)
+            for number in iter_numbers(source):
+                block.append(number)
+                if len(block) >= WRITE_BLOCK:
+                    _to_little_endian(block).tofile(f)
+                    count += len(block)
+                    block = array(TYPECODE)
+            _to_little_endian(block).tofile(f)
+            count += len(block)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, TYPECODE.encode(), count))
+        return count
+    numbers = read_dataset(source, mode='r')
+    write_dataset(target, numbers)
+    return len(numbers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Converte datasets entre texto/CSV, .bin e .npy.")
+    parser.add_argument('source')
+    parser.add_argument('target')
+    args = parser.parse_args()
+    total = convert(args.source, args.target)
+    print(f"{total} números convertidos de {args.source} para {args.target} "
+          f"({os.path.getsize(args.target)} bytes).")
@@ -0,0 +1,82 @@
+import random
+
+# Geradores de entrada nomeados; todos recebem (tamanho, rng, valor máximo)
+
+
+def uniform(size, rng, max_value):
+    return [rng.randint(0, max_value) for _ in range(size)]
+
+
+def sorted_values(size, rng, max_value):
+    return sorted(uniform(size, rng, max_value))
+
+
+def reversed_values(size, rng, max_value):
+    return sorted(uniform(size, rng, max_value), reverse=True)
+
+
+def nearly_sorted(size, rng, max_value, swaps=None):
+    # k trocas aleatórias sobre a entrada ordenada (padrão: 1% do tamanho)
+    data = sorted_values(size, rng, max_value)
+    if size > 1:
+        for _ in range(swaps if swaps is not None else max(1, size // 100)):
+            i = rng.randrange(size)
+            j = rng.randrange(size)
+            data[i], data[j] = data[j], data[i]
+    return data
+
+
+def organ_pipe(size, rng, max_value):
+    # Sobe até o meio e desce: 0, 1, 2, ..., 2, 1, 0
+    half = sorted(uniform((size + 1) // 2, rng, max_value))
+    return half + half[:size // 2][::-1]
+
+
+def sawtooth(size, rng, max_value, teeth=16):
+    tooth = max(1, size // teeth)
+    return [(i % tooth) * max_value // tooth for i in range(size)]
+
+
+def few_unique(size, rng, max_value, distinct=16):
+    values = [rng.randint(0, max_value) for _ in range(distinct)]
+    return [rng.choice(values) for _ in range(size)]
+
+
+def zipf(size, rng, max_value, s=1.2):
+    # Amostragem por inversão da CDF de Zipf sobre os ranks 1..universe
+    universe = min(max_value, max(size, 1))
+    weights = [1 / (rank ** s) for rank in range(1, universe + 1)]
+    return rng.choices(range(1, universe + 1), weights=weights, k=size)
+
+
+def wide_range(size, rng, max_value):
+    # Inteiros de 62 bits com sinal, independentemente de max_value
+    return [rng.randint(-(2 ** 62), 2 ** 62) for _ in range(size)]
+
+
+DISTRIBUTIONS = {
+    'uniform': uniform,
+    'sorted': sorted_values,
+    'reversed': reversed_values,
+    'nearly_sorted': nearly_sorted,
+    'organ_pipe': organ_pipe,
+    'sawtooth': sawtooth,
+    'few_unique': few_unique,
+    'zipf': zipf,
+    'wide_range': wide_range,
+}
+
+
+def generate_distribution(name, size, seed=None, max_value=1000000):
+    if name not in DISTRIBUTIONS:
+        raise KeyError(f"Distribuição desconhecida: {name}. Opções: {', '.join(DISTRIBUTIONS)}")
+    return DISTRIBUTIONS[name](size, random.Random(seed), max_value)
+
+
+def geometric_sizes(min_size, max_size, factor=10):
+    sizes = []
+    size = min_size
+    while size <= max_size:
+        sizes.append(int(size))
+        size *= factor
+    return sizes
@@ -0,0 +1,181 @@
+import argparse
+import heapq
+import os
+import tempfile
+from array import array
+from algorithms.buffer_backend import np
+from algorithms.sort_context import SortContext
+
+# Memória estimada por número: 8 bytes em array('q') quando o backend de buffer
+# está disponível, ou ponteiro + objeto int (~36 bytes) em uma lista Python
+BUFFER_BYTES_PER_NUMBER = 8
+LIST_BYTES_PER_NUMBER = 36
+RUN_TYPECODE = 'q'
+READ_BLOCK = 1 << 16
+SEPARATORS = ', \t\r\n'
+
+
+class ExternalSortStats:
+    def __init__(self):
+        self.numbers = 0
+        self.runs = 0
+        self.spill_bytes = 0
+        self.merge_passes = 0
+
+    def __str__(self):
+        return (f"Números={self.numbers}, Runs={self.runs}, "
+                f"Bytes em disco={self.spill_bytes}, Passadas de merge={self.merge_passes}")
+
+
+def iter_numbers(path, block_size=READ_BLOCK):
+    """Lê inteiros separados por vírgula ou quebra de linha sem carregar o arquivo inteiro."""
+    pending = ''
+    with open(path, 'r') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            text = pending + block
+            tokens = text.replace(',', ' ').split()
+            # O último token pode ter sido cortado no meio pelo limite do bloco
+            if tokens and text[-1] not in SEPARATORS:
+                pending = tokens.pop()
+            else:
+                pending = ''
+            for token in tokens:
+                yield int(token)
+    if pending:
+        yield int(pending)
+
+
+def iter_run(path, buffer_items):
+    """Percorre uma run ordenada do disco lendo no máximo buffer_items por vez."""
+    with open(path, 'rb') as f:
+        while True:
+            block = array(RUN_TYPECODE)
+            try:
+                block.fromfile(f, buffer_items)
+            except EOFError:
+                pass  # bloco final menor que o buffer
+            if not block:
+                return
+            yield from block
+
+
+class ExternalSort:
+    def __init__(self, strategy, memory_budget=64 * 1024 * 1024, fan_in=16, tmp_dir=None):
+        if fan_in < 2:
+            raise ValueError("fan_in precisa ser pelo menos 2.")
+        self.context = SortContext(strategy)
+        self.memory_budget = memory_budget
+        self.fan_in = fan_in
+        self.tmp_dir = tmp_dir
+        self.use_buffer = np is not None
+
+    def sort_file(self, input_path, output_path, delimiter='\n'):
+        stats = ExternalSortStats()
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as work_dir:
+            runs = self._spill_runs(input_path, work_dir, stats)
+            # Enquanto houver mais runs que o fan-in, faz passadas intermediárias
+            while len(runs) > self.fan_in:
+                merged = []
+                for start in range(0, len(runs), self.fan_in):
+                    group = runs[start:start + self.fan_in]
+                    run_path = os.path.join(work_dir, f'run_{stats.merge_passes}_{start}.bin')
+                    with open(run_path, 'wb') as out:
+                        self._write_run(out, self._merge(group))
+                    stats.spill_bytes += os.path.getsize(run_path)
+                    for path in group:
+                        os.remove(path)
+                    merged.append(run_path)
+                runs = merged
+                stats.merge_passes += 1
+            with open(output_path, 'w', newline='') as out:
+                self._write_text(out, self._merge(runs), delimiter)
+            stats.merge_passes += 1
+        return stats
+
+    def _chunk_size(self):
+        per_number = BUFFER_BYTES_PER_NUMBER if self.use_buffer else LIST_BYTES_PER_NUMBER
+        return max(1, self.memory_budget // per_number)
+
+    def _new_chunk(self):
+        return array(RUN_TYPECODE) if self.use_buffer else []
+
+    def _spill_runs(self, input_path, work_dir, stats):
+        chunk_size = self._chunk_size()
+        runs = []
+        chunk = self._new_chunk()
+        for number in iter_numbers(input_path):
+            chunk.append(number)
+            if len(chunk) >= chunk_size:
+                runs.append(self._spill(chunk, work_dir, len(runs), stats))
+                chunk = self._new_chunk()
+        if chunk:
+            runs.append(self._spill(chunk, work_dir, len(runs), stats))
+        return runs
+
+    def _spill(self, chunk, work_dir, index, stats):
+        self.context.execute_sort(chunk)
+        run_path = os.path.join(work_dir, f'run_{index}.bin')
+        if not isinstance(chunk, array):
+            chunk = array(RUN_TYPECODE, chunk)
+        with open(run_path, 'wb') as out:
+            chunk.tofile(out)
+        stats.numbers += len(chunk)
+        stats.runs += 1
+        stats.spill_bytes += os.path.getsize(run_path)
+        return run_path
+
+    def _merge(self, runs):
+        # Cada run ganha um buffer de leitura; um buffer extra fica para a saída
+        buffer_items = max(1, self.memory_budget // (len(runs) + 1) // BUFFER_BYTES_PER_NUMBER)
+        return heapq.merge(*(iter_run(path, buffer_items) for path in runs))
+
+    def _write_run(self, out, numbers):
+        block = array(RUN_TYPECODE)
+        for number in numbers:
+            block.append(number)
+            if len(block) >= READ_BLOCK:
+                block.tofile(out)
+                block = array(RUN_TYPECODE)
+        block.tofile(out)
+
+    def _write_text(self, out, numbers, delimiter):
+        block = []
+        first = True
+        for number in numbers:
+            block.append(str(number))
+            if len(block) >= READ_BLOCK:
+                out.write(('' if first else delimiter) + delimiter.join(block))
+                first = False
+                block = []
+        if block:
+            out.write(('' if first else delimiter) + delimiter.join(block))
+
+
+def parse_size(text):
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+if __name__ == "__main__":
+    from main import strategy_by_name
+
+    parser = argparse.ArgumentParser(description="Ordenação externa de arquivos de números.")
+    parser.add_argument('input', help="arquivo de entrada (CSV de uma linha ou um número por linha)")
+    parser.add_argument('output', help="arquivo de saída ordenado")
+    parser.add_argument('--method', default='tim_sort', help="estratégia usada em cada bloco")
+    parser.add_argument('--memory', default='64M', help="orçamento de memória (ex.: 512M, 2G)")
+    parser.add_argument('--fan-in', type=int, default=16, help="runs intercaladas por passada")
+    parser.add_argument('--delimiter', default='\n', help="separador da saída (use , para CSV)")
+    parser.add_argument('--tmp-dir', default=None)
+    args = parser.parse_args()
+
+    sorter = ExternalSort(strategy_by_name(args.method), parse_size(args.memory),
+                          args.fan_in, args.tmp_dir)
+    stats = sorter.sort_file(args.input, args.output, args.delimiter)
+    print(f"Arquivo {args.output} gerado com sucesso! {stats}")
@@ -1,9 +1,21 @@
+import argparse
 import random
 import csv
+from distributions import DISTRIBUTIONS, generate_distribution
 
-numbers = [random.randint(1, 1000000) for _ in range(10000)]
+parser = argparse.ArgumentParser(description="Gera o dataset de números em CSV.")
+parser.add_argument('--size', type=int, default=10000)
+parser.add_argument('--distribution', choices=list(DISTRIBUTIONS), default=None,
+                    help="distribuição nomeada; sem ela, inteiros uniformes em [1, 1000000]")
+parser.add_argument('--output', default='random_numbers.csv')
+args = parser.parse_args()
 
-# Gera os números aleatórios e salva em um arquivo CSV
-with open('random_numbers.csv', 'w', newline='') as f:
+if args.distribution is None:
+    numbers = [random.randint(1, 1000000) for _ in range(args.size)]
+else:
+    numbers = generate_distribution(args.distribution, args.size)
+
+# Gera os números e salva em um arquivo CSV
+with open(args.output, 'w', newline='') as f:
     writer = csv.writer(f)
-    writer.writerow(numbers)
+    writer.writerow(numbers)
\ No newline at end of file
@@ -0,0 +1,271 @@
+import argparse
+import inspect
+import linecache
+import os
+import sys
+import time
+from collections import Counter
+from algorithms.registry import get_spec, specs
+from distributions import DISTRIBUTIONS, generate_distribution
+
+MONITORING = getattr(sys, 'monitoring', None)
+PROFILES_DIR = os.path.join('results', 'profiles')
+
+
+def _frame_name(code):
+    return f"{os.path.splitext(os.path.basename(code.co_filename))[0]}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class FunctionStats:
+    __slots__ = ('calls', 'total_ns', 'self_ns', 'max_depth', 'active')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.max_depth = 0
+        # Chamadas recursivas em andamento: só a mais externa soma em total_ns
+        self.active = 0
+
+    def to_dict(self):
+        return {'calls': self.calls, 'total_ns': self.total_ns, 'self_ns': self.self_ns,
+                'max_depth': self.max_depth}
+
+
+class HotpathProfile:
+    """Resultado de uma execução: contagem por linha, tempo por função e pilhas colapsadas.
+
+    Os tempos incluem o custo do próprio rastreamento; servem para comparar trechos entre si,
+    não como medida absoluta (para isso há o benchmark de sort_all.py).
+    """
+
+    def __init__(self, label, backend):
+        self.label = label
+        self.backend = backend
+        self.line_counts = Counter()
+        self.functions = {}
+        self.stacks = Counter()
+        self.max_depth = 0
+        self.elapsed_ns = 0
+
+    def hot_lines(self, top=10):
+        return self.line_counts.most_common(top)
+
+    def hot_functions(self, top=10):
+        ranked = sorted(self.functions.items(), key=lambda item: item[1].self_ns, reverse=True)
+        return ranked[:top]
+
+    def write_collapsed(self, path):
+        """Formato do flamegraph.pl / inferno / speedscope: 'f1;f2;f3 peso', peso em ns de tempo próprio."""
+        with open(path, 'w') as f:
+            for stack, weight in sorted(self.stacks.items()):
+                if weight > 0:
+                    f.write(f"{stack} {weight}\n")
+
+    def summary(self, top=10):
+        lines = [f"== {self.label} ({self.backend}): {self.elapsed_ns / 1e6:.2f} ms, "
+                 f"{sum(self.line_counts.values())} linhas executadas, profundidade máxima {self.max_depth}"]
+        lines.append(f"{'próprio ms':>11} {'total ms':>10} {'chamadas':>9} {'prof.':>6}  função")
+        for name, stats in self.hot_functions(top):
+            lines.append(f"{stats.self_ns / 1e6:>11.2f} {stats.total_ns / 1e6:>10.2f} {stats.calls:>9} "
+                         f"{stats.max_depth:>6}  {name}")
+        lines.append(f"{'execuções':>11}  linha")
+        for (filename, lineno), count in self.hot_lines(top):
+            source = linecache.getline(filename, lineno).strip()
+            lines.append(f"{count:>11}  {os.path.basename(filename)}:{lineno}  {source}")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        return {
+            'label': self.label,
+            'backend': self.backend,
+            'elapsed_ns': self.elapsed_ns,
+            'max_depth': self.max_depth,
+            'functions': {name: stats.to_dict() for name, stats in self.functions.items()},
+            'lines': [[filename, lineno, count] for (filename, lineno), count in self.line_counts.most_common()],
+        }
+
+
+class HotpathProfiler:
+    """Perfila uma estratégia sem alterar seu código: sys.monitoring (3.12+) ou sys.settrace.
+
+    Só funções em arquivos sob os diretórios de include entram nas pilhas e contagens; o tempo
+    gasto fora delas (stdlib, funções em C) fica como tempo próprio de quem chamou. Por padrão,
+    o diretório do módulo da estratégia. sys.monitoring vale para todas as threads, settrace só
+    para a thread atual.
+    """
+
+    def __init__(self, include=None, backend=None):
+        self.include = [os.path.realpath(path) for path in include] if include else None
+        if backend is None:
+            backend = 'monitoring' if MONITORING is not None else 'settrace'
+        if backend == 'monitoring' and MONITORING is None:
+            raise RuntimeError("sys.monitoring requer Python 3.12+; use backend='settrace'.")
+        self.backend = backend
+        self._wanted = {}
+
+    def profile(self, strategy, data, label=None):
+        """Roda strategy.sort sobre uma cópia de data e devolve o HotpathProfile."""
+        arr = list(data)
+        include = self.include or [os.path.dirname(os.path.realpath(inspect.getfile(type(strategy))))]
+        profile = HotpathProfile(label or type(strategy).__name__, self.backend)
+        self._start(profile, include)
+        start = time.perf_counter_ns()
+        try:
+            strategy.sort(arr)
+        finally:
+            profile.elapsed_ns = time.perf_counter_ns() - start
+            self._stop()
+        return profile
+
+    # Estado compartilhado pelos dois backends
+    def _start(self, profile, include):
+        self._profile = profile
+        self._include = include
+        self._wanted = {}
+        self._stack = []
+        if self.backend == 'monitoring':
+            self._start_monitoring()
+        else:
+            sys.settrace(self._trace_call)
+
+    def _stop(self):
+        if self.backend == 'monitoring':
+            self._stop_monitoring()
+        else:
+            sys.settrace(None)
+        self._stack = []
+
+    def _is_wanted(self, code):
+        wanted = self._wanted.get(code)
+        if wanted is None:
+            path = os.path.realpath(code.co_filename)
+            wanted = path != os.path.realpath(__file__) and any(
+                path.startswith(directory + os.sep) for directory in self._include
+            )
+            self._wanted[code] = wanted
+        return wanted
+
+    def _enter(self, code):
+        name = _frame_name(code)
+        stats = self._profile.functions.get(name)
+        if stats is None:
+            stats = self._profile.functions[name] = FunctionStats()
+        stats.calls += 1
+        stats.active += 1
+        depth = len(self._stack) + 1
+        if depth > stats.max_depth:
+            stats.max_depth = depth
+        if depth > self._profile.max_depth:
+            self._profile.max_depth = depth
+        parent = self._stack[-1][1] if self._stack else ''
+        # (code, pilha colapsada, estatísticas, início, tempo dos filhos)
+        self._stack.append([code, f"{parent};{name}" if parent else name, stats, time.perf_counter_ns(), 0])
+
+    def _exit(self, code):
+        if not self._stack or self._stack[-1][0] is not code:
+            return
+        _, stack, stats, start, children = self._stack.pop()
+        elapsed = time.perf_counter_ns() - start
+        stats.active -= 1
+        if stats.active == 0:
+            stats.total_ns += elapsed
+        stats.self_ns += elapsed - children
+        self._profile.stacks[stack] += elapsed - children
+        if self._stack:
+            self._stack[-1][4] += elapsed
+
+    # Backend sys.settrace
+    def _trace_call(self, frame, event, arg):
+        if event != 'call' or not self._is_wanted(frame.f_code):
+            return None
+        self._enter(frame.f_code)
+        return self._trace_local
+
+    def _trace_local(self, frame, event, arg):
+        if event == 'line':
+            self._profile.line_counts[(frame.f_code.co_filename, frame.f_lineno)] += 1
+        elif event == 'return':
+            self._exit(frame.f_code)
+        return self._trace_local
+
+    # Backend sys.monitoring
+    def _start_monitoring(self):
+        tool = MONITORING.PROFILER_ID
+        events = MONITORING.events
+        MONITORING.use_tool_id(tool, 'hotpath_profiler')
+        callbacks = {
+            events.PY_START: self._on_start,
+            events.PY_RESUME: self._on_start,
+            events.PY_RETURN: self._on_return,
+            events.PY_YIELD: self._on_return,
+            events.PY_UNWIND: self._on_unwind,
+            events.LINE: self._on_line,
+        }
+        for event, callback in callbacks.items():
+            MONITORING.register_callback(tool, event, callback)
+        MONITORING.set_events(tool, sum(callbacks))
+        # Locais desativadas (DISABLE) numa execução anterior voltam a gerar eventos
+        MONITORING.restart_events()
+
+    def _stop_monitoring(self):
+        tool = MONITORING.PROFILER_ID
+        MONITORING.set_events(tool, MONITORING.events.NO_EVENTS)
+        for event in (MONITORING.events.PY_START, MONITORING.events.PY_RESUME, MONITORING.events.PY_RETURN,
+                      MONITORING.events.PY_YIELD, MONITORING.events.PY_UNWIND, MONITORING.events.LINE):
+            MONITORING.register_callback(tool, event, None)
+        MONITORING.free_tool_id(tool)
+
+    def _on_start(self, code, offset):
+        if not self._is_wanted(code):
+            return MONITORING.DISABLE
+        self._enter(code)
+
+    def _on_return(self, code, offset, value):
+        if not self._is_wanted(code):
+            return MONITORING.DISABLE
+        self._exit(code)
+
+    def _on_unwind(self, code, offset, exception):
+        # PY_UNWIND não pode ser desativado por local
+        if self._is_wanted(code):
+            self._exit(code)
+
+    def _on_line(self, code, lineno):
+        if not self._is_wanted(code):
+            return MONITORING.DISABLE
+        self._profile.line_counts[(code.co_filename, lineno)] += 1
+
+
+def profile_strategy(name, data, include=None, backend=None):
+    spec = get_spec(name)
+    return HotpathProfiler(include, backend).profile(spec.create(), data, label=spec.label)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Linhas e funções quentes das estratégias, sem instrumentação manual.")
+    parser.add_argument('--algorithms', nargs='+', default=None, help="nomes do registro (padrão: todos)")
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--distribution', default='uniform', choices=list(DISTRIBUTIONS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--backend', choices=['monitoring', 'settrace'], default=None)
+    parser.add_argument('--output-dir', default=PROFILES_DIR, help="onde gravar os .folded (pilhas colapsadas)")
+    args = parser.parse_args()
+
+    data = generate_distribution(args.distribution, args.size, seed=args.seed)
+    names = args.algorithms or [spec.name for spec in specs()]
+    os.makedirs(args.output_dir, exist_ok=True)
+    overview = []
+    for name in names:
+        profile = profile_strategy(name, data, backend=args.backend)
+        path = os.path.join(args.output_dir, f"{name}_{args.distribution}_{args.size}.folded")
+        profile.write_collapsed(path)
+        print(profile.summary(args.top))
+        print(f"Pilhas colapsadas em {path}.\n")
+        hottest = profile.hot_lines(1)
+        overview.append((profile.label, profile.elapsed_ns, sum(profile.line_counts.values()),
+                         hottest[0][1] if hottest else 0))
+    print(f"{'estratégia':<22} {'ms':>10} {'linhas':>12} {'linha mais quente':>18}")
+    for label, elapsed, total_lines, hottest in sorted(overview, key=lambda row: row[1]):
+        print(f"{label:<22} {elapsed / 1e6:>10.2f} {total_lines:>12} {hottest:>18}")
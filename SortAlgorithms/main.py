@@ -1,113 +1,168 @@
 import csv
-import json
-from algorithms.bubble_sort import BubbleSort
-from algorithms.bubble_sort_optimized import BubbleSortOptimized
-from algorithms.counting_sort import CountingSort
-from algorithms.insertion_sort import InsertionSort
-from algorithms.selection_sort import SelectionSort
-from algorithms.quick_sort import QuickSort
-from algorithms.merge_sort import MergeSort
-from algorithms.heap_sort import HeapSort
-from algorithms.shell_sort import ShellSort
-from algorithms.radix_sort import RadixSort
-from algorithms.tim_sort import TimSort
+import os
+import sys
+from algorithms.registry import create_strategy, specs
 from algorithms.sort_context import SortContext
+from binary_format import is_binary_path, read_dataset, write_dataset
+from search_cache import SearchCache, dataset_fingerprint
+from sorted_collection import SortedCollection
+from sorted_output_cache import SortedOutputCache, cache_key, file_fingerprint
+
+COLLECTION_FILE = 'results/sorted_collection.bin'
 
 class BinarySearchWithCache:
-    def __init__(self, cache_file='search_cache.json'):
-        self.cache_file = cache_file
-        self.cache = self.load_cache()
+    def __init__(self, cache_file='search_cache.sqlite3', max_entries=100000, batch_size=512):
+        self.cache = SearchCache(cache_file, max_entries, batch_size)
+        self._last_arr = None
+        self._last_version = None
+        self._last_fingerprint = None
+
+    def fingerprint(self, arr):
+        """Hash do dataset, memorizado enquanto o mesmo objeto estiver na mesma versão.
 
-    def load_cache(self):
-        try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        Só coleções com version (SortedCollection) têm hash memorizado; para as demais
+        devolve None, porque não há como detectar alterações in-place sem refazer o hash.
+        """
+        version = getattr(arr, 'version', None)
+        if version is None:
+            return None
+        if arr is not self._last_arr or version != self._last_version:
+            self._last_arr = arr
+            self._last_version = version
+            self._last_fingerprint = dataset_fingerprint(arr)
+        return self._last_fingerprint
 
-    def save_cache(self):
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f)
+    def binary_search(self, arr, target, fingerprint=None):
+        """fingerprint: chave do dataset calculada pelo chamador ao carregá-lo (ex.: dataset_fingerprint).
 
-    def binary_search(self, arr, target, left=0, right=None):
-        if right is None:
-            right = len(arr) - 1
+        Sem ela, e sem version no arr, a busca não passa pelo cache: refazer o hash O(n)
+        a cada chamada custaria mais que a própria busca O(log n).
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(arr)
 
         # Verifica o cache
-        if str(target) in self.cache:
-            return self.cache[str(target)]
-
-        if left > right:
-            self.cache[str(target)] = -1  # Armazena resultado no cache
-            self.save_cache()
-            return -1
-
-        mid = (left + right) // 2
-
-        if arr[mid] == target:
-            self.cache[str(target)] = mid  # Armazena resultado no cache
-            self.save_cache()
-            return mid
-        elif arr[mid] < target:
-            result = self.binary_search(arr, target, mid + 1, right)
-        else:
-            result = self.binary_search(arr, target, left, mid - 1)
-        
-        self.cache[str(target)] = result  # Armazena resultado no cache
-        self.save_cache()
+        cached = self.cache.get(fingerprint, target) if fingerprint is not None else None
+        if cached is not None:
+            return cached
+
+        if isinstance(arr, SortedCollection):
+            # Busca direto nos blocos, sem materializar a coleção
+            result = arr.find(target)
+            if fingerprint is not None:
+                self.cache.put(fingerprint, target, result)
+            return result
+
+        left, right = 0, len(arr) - 1
+        result = -1
+        while left <= right:
+            mid = (left + right) // 2
+            if arr[mid] == target:
+                result = mid
+                break
+            elif arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+
+        if fingerprint is not None:
+            self.cache.put(fingerprint, target, result)  # Gravado em lote no próximo flush
         return result
 
+    def close(self):
+        self.cache.close()
+
 def read_numbers(file):
+    # Formatos binários (.bin/.npy) são mapeados em memória, sem montar listas
+    if is_binary_path(file):
+        return read_dataset(file)
     with open(file, 'r') as f:
         reader = csv.reader(f)
         return [int(num) for row in reader for num in row]
 
 def save_numbers(file, numbers):
+    if is_binary_path(file):
+        write_dataset(file, numbers)
+        return
     with open(file, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(numbers)
 
-def choice_method():
-    # Métodos de ordenação disponíveis
-    methods = {
-        '1': ('bubble_sort', BubbleSort()),
-        '2': ('bubble_sort_optimized', BubbleSortOptimized()),
-        '3': ('insertion_sort', InsertionSort()),
-        '4': ('selection_sort', SelectionSort()),
-        '5': ('quick_sort', QuickSort()),
-        '6': ('merge_sort', MergeSort()),
-        '7': ('heap_sort', HeapSort()),
-        '8': ('shell_sort', ShellSort()),
-        '9': ('counting_sort', CountingSort()),
-        '10': ('radix_sort', RadixSort()),
-        '11': ('tim_sort', TimSort())
-    }
+def incremental_sort(input_file, numbers, strategy, state_file=COLLECTION_FILE):
+    """Mantém uma SortedCollection persistida da entrada e só ordena o que foi acrescentado.
+
+    Os metadados guardam quantos números da entrada já foram incorporados e o hash desse
+    prefixo; se o arquivo mudou além de um simples acréscimo, a coleção é refeita do zero.
+    """
+    collection, meta = None, {}
+    if os.path.exists(state_file):
+        collection, meta = SortedCollection.load(state_file)
+    count = meta.get('source_count', 0)
+    if (collection is None or meta.get('source') != os.path.abspath(input_file)
+            or count > len(numbers) or meta.get('prefix') != dataset_fingerprint(numbers[:count])):
+        collection = SortedCollection()
+        count = 0
+    tail = list(numbers[count:])
+    if tail:
+        SortContext(strategy).execute_sort(tail)
+        collection.update(tail)
+    collection.save(state_file, {
+        'source': os.path.abspath(input_file),
+        'source_count': len(numbers),
+        'prefix': dataset_fingerprint(numbers),
+    })
+    return collection, len(tail)
+
+# Métodos de ordenação disponíveis, na ordem do registro; os módulos só são
+# importados quando o método é escolhido
+METHODS = {str(number): spec for number, spec in enumerate(specs(), start=1)}
 
+def strategy_by_name(name):
+    return create_strategy(name)
+
+def choice_method():
     print("Escolha o método de ordenação:")
 
-    for key, (name, _) in methods.items():
-        print(f"{key} - {name.replace('_', ' ').title()}")
+    for key, spec in METHODS.items():
+        print(f"{key} - {spec.name.replace('_', ' ').title()}")
     choice = input("Digite o número correspondente: ")
-    return methods.get(choice, None)
+    spec = METHODS.get(choice, None)
+    return (spec.name, spec.create()) if spec else None
 
 if __name__ == "__main__":
     methods = choice_method()
     # Verifica se a escolha é válida
     if methods:
         name_method, strategy_instance = methods
-        numbers = read_numbers('random_numbers.csv')
-        context = SortContext(strategy_instance)
-        context.execute_sort(numbers)
-        save_numbers(f'results/{name_method}.csv', numbers)
-        print(f"Arquivo {name_method}.csv gerado com sucesso!")
+        input_file = sys.argv[1] if len(sys.argv) > 1 else 'random_numbers.csv'
+        # Entrada já vista (por qualquer método): o resultado sai do cache, sem ordenar
+        cache = SortedOutputCache()
+        key = cache_key(file_fingerprint(input_file))
+        collection = cache.get(key)
+        if collection is not None:
+            print(f"Entrada sem alterações: {len(collection)} números lidos do cache.")
+            sorted_numbers = collection
+        else:
+            numbers = read_numbers(input_file)
+            # Só os números acrescentados desde a última execução são ordenados e intercalados
+            collection, added = incremental_sort(input_file, numbers, strategy_instance)
+            print(f"{added} de {len(numbers)} números ordenados nesta execução.")
+            sorted_numbers = list(collection)
+            cache.put(key, sorted_numbers, name_method)
+        # O resultado segue o formato da entrada (texto -> .csv, binário -> mesma extensão)
+        extension = os.path.splitext(input_file)[1] if is_binary_path(input_file) else '.csv'
+        save_numbers(f'results/{name_method}{extension}', sorted_numbers)
+        print(f"Arquivo {name_method}{extension} gerado com sucesso!")
 
         # Teste de busca binária com cache
         searcher = BinarySearchWithCache()
         target = int(input("Digite um número para buscar: "))
-        index = searcher.binary_search(numbers, target)
+        # A chave da entrada identifica o dataset ordenado sem refazer o hash a cada busca
+        index = searcher.binary_search(collection, target, fingerprint=key)
         if index != -1:
             print(f"Número encontrado na posição {index}.")
         else:
             print("Número não encontrado.")
+        searcher.close()
     else:
         print("Opção inválida!")
\ No newline at end of file
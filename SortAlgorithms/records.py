@@ -0,0 +1,64 @@
+import argparse
+import csv
+import json
+import re
+import time
+from algorithms.registry import create_strategy
+from algorithms.sort_context import SortContext
+
+
+INTEGER = re.compile(r'[+-]?\d+')
+
+
+def read_records(path):
+    """Lê registros de JSONL (um objeto por linha) ou CSV com cabeçalho (dicts de texto)."""
+    if path.lower().endswith('.csv'):
+        with open(path, 'r', newline='') as f:
+            return list(csv.DictReader(f))
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_records(path, records):
+    if path.lower().endswith('.csv'):
+        fieldnames = list(dict.fromkeys(field for record in records for field in record))
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(records)
+        return
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def integer_keys(records, fields):
+    """Chaves para campos de CSV: o campo vira int (e usa o radix) só se todos os valores
+    da coluna forem inteiros; senão fica o texto. Os registros não são alterados.
+    """
+    keys = []
+    for field in fields:
+        if records and all(isinstance(record.get(field), str) and INTEGER.fullmatch(record[field])
+                           for record in records):
+            keys.append(lambda record, field=field: int(record[field]))
+        else:
+            keys.append(field)
+    return keys
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ordena registros JSONL/CSV por um ou mais campos.")
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--key', nargs='+', required=True, help="campos, do primário para o secundário")
+    parser.add_argument('--reverse', action='store_true')
+    parser.add_argument('--method', default='tim_sort', help="estratégia para chaves não inteiras")
+    args = parser.parse_args()
+
+    records = read_records(args.input)
+    start = time.perf_counter()
+    key = integer_keys(records, args.key) if args.input.lower().endswith('.csv') else args.key
+    SortContext(create_strategy(args.method)).execute_sort(records, key=key, reverse=args.reverse)
+    elapsed = time.perf_counter() - start
+    write_records(args.output, records)
+    print(f"{len(records)} registros ordenados por {', '.join(args.key)} em {elapsed:.3f} s.")
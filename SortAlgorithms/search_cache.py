@@ -0,0 +1,101 @@
+import atexit
+import hashlib
+import sqlite3
+from array import array
+from collections import OrderedDict
+
+
+def dataset_fingerprint(arr):
+    """Hash do conteúdo do array ordenado; identifica o dataset ao qual um resultado pertence."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        data = memoryview(arr).cast('B')
+    except TypeError:
+        try:
+            data = array('q', arr)
+        except (TypeError, OverflowError):
+            # floats, strings, inteiros além de int64
+            data = repr(list(arr)).encode()
+    digest.update(len(arr).to_bytes(8, 'little'))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class SearchCache:
+    """Cache persistente (SQLite) de resultados de busca, com LRU limitado e gravação em lotes."""
+
+    def __init__(self, path='search_cache.sqlite3', max_entries=100000, batch_size=512):
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' fingerprint TEXT NOT NULL,'
+            ' target INTEGER NOT NULL,'
+            ' result INTEGER NOT NULL,'
+            ' last_used INTEGER NOT NULL,'
+            ' PRIMARY KEY (fingerprint, target))'
+        )
+        self.clock = self.conn.execute('SELECT COALESCE(MAX(last_used), 0) FROM entries').fetchone()[0]
+        atexit.register(self.close)
+
+    def get(self, fingerprint, target):
+        key = (fingerprint, target)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        row = self.conn.execute(
+            'SELECT result FROM entries WHERE fingerprint = ? AND target = ?', key
+        ).fetchone()
+        if row is None:
+            return None
+        # Acerto no disco: promove para a memória e atualiza o last_used no próximo flush
+        self._remember(key, row[0])
+        self._mark_dirty(key, row[0])
+        return row[0]
+
+    def put(self, fingerprint, target, result):
+        key = (fingerprint, target)
+        self._remember(key, result)
+        self._mark_dirty(key, result)
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows = []
+        for (fingerprint, target), result in self.pending.items():
+            self.clock += 1
+            rows.append((fingerprint, target, result, self.clock))
+        self.pending.clear()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO entries (fingerprint, target, result, last_used) '
+                'VALUES (?, ?, ?, ?)', rows
+            )
+            # Mantém no disco apenas as max_entries usadas mais recentemente
+            self.conn.execute(
+                'DELETE FROM entries WHERE rowid IN ('
+                ' SELECT rowid FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def close(self):
+        if self.conn is None:
+            return
+        self.flush()
+        self.conn.close()
+        self.conn = None
+        atexit.unregister(self.close)
+
+    def _remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _mark_dirty(self, key, result):
+        self.pending[key] = result
+        if len(self.pending) >= self.batch_size:
+            self.flush()
@@ -0,0 +1,320 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from prometheus_client import start_http_server, Counter, Histogram
+from algorithms.buffer_backend import np
+from algorithms.registry import create_strategy
+from algorithms.sort_context import SortContext
+from algorithms.selection import top_k, top_k_file
+from batch_search import batch_search, load_sorted
+from binary_format import is_binary_path, read_dataset
+
+#########################
+# Métricas do serviço
+#########################
+REQUEST_LATENCY = Histogram(
+    "sort_service_request_seconds", "Latência por requisição do serviço de ordenação/busca", ["endpoint"]
+)
+SEARCH_BATCH_SIZE = Histogram(
+    "sort_service_search_batch_size",
+    "Requisições de busca atendidas por uma única chamada a batch_search",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+REQUESTS_REJECTED = Counter(
+    "sort_service_rejected_total", "Requisições recusadas por fila cheia (503)", ["endpoint"]
+)
+
+MAX_BODY = 64 * 1024 * 1024
+
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _sort_job(method, numbers):
+    # Executado no pool de processos: só o módulo da estratégia pedida é importado
+    SortContext(create_strategy(method)).execute_sort(numbers)
+    return numbers
+
+
+def _top_k_job(numbers, path, k, largest):
+    if path is not None:
+        return top_k_file(path, k, largest)
+    return top_k(numbers, k, largest)
+
+
+class DatasetStore:
+    """Datasets ordenados mantidos em memória entre requisições, recarregados se o arquivo mudar."""
+
+    def __init__(self, data_dir):
+        self.data_dir = os.path.realpath(data_dir)
+        self.datasets = {}
+
+    def resolve(self, path):
+        full = os.path.realpath(os.path.join(self.data_dir, path))
+        if os.path.commonpath([full, self.data_dir]) != self.data_dir:
+            raise ServiceError(HTTPStatus.FORBIDDEN, f"Caminho fora de {self.data_dir}: {path}")
+        if not os.path.exists(full):
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Dataset não encontrado: {path}")
+        return full
+
+    async def get(self, path):
+        full = self.resolve(path)
+        mtime = os.path.getmtime(full)
+        cached = self.datasets.get(full)
+        if cached is None or cached[0] != mtime:
+            values = await asyncio.to_thread(self._load, full)
+            self.datasets[full] = cached = (mtime, values)
+        return cached[1]
+
+    def _load(self, path):
+        values = read_dataset(path, mode='r') if is_binary_path(path) else load_sorted(path)
+        if np is not None:
+            values = np.asarray(values)
+            if len(values) > 1 and not (values[1:] >= values[:-1]).all():
+                values = np.sort(values)
+        elif any(values[i] > values[i + 1] for i in range(len(values) - 1)):
+            values = sorted(values)
+        logging.info(f"Dataset {path} carregado ({len(values)} números).")
+        return values
+
+
+class SearchBatcher:
+    """Junta buscas concorrentes no mesmo dataset em uma única chamada a batch_search."""
+
+    def __init__(self, store, queue_size=1024, max_batch=256, window=0.002):
+        self.store = store
+        self.queue_size = queue_size
+        self.max_batch = max_batch
+        self.window = window
+        # Uma fila e um consumidor por dataset existente, pelo caminho resolvido:
+        # nomes inválidos dão 404 antes de criar qualquer coisa
+        self.queues = {}
+        self.consumers = {}
+
+    async def search(self, dataset, targets):
+        path = self.store.resolve(dataset)
+        queue = self.queues.get(path)
+        if queue is None:
+            queue = self.queues[path] = asyncio.Queue(self.queue_size)
+            self.consumers[path] = asyncio.create_task(self._consume(path, queue))
+        future = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((targets, future))
+        except asyncio.QueueFull:
+            REQUESTS_REJECTED.labels(endpoint="search").inc()
+            raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "Fila de buscas cheia.")
+        return await future
+
+    async def close(self):
+        for task in self.consumers.values():
+            task.cancel()
+        await asyncio.gather(*self.consumers.values(), return_exceptions=True)
+        self.consumers.clear()
+        self.queues.clear()
+
+    async def _consume(self, path, queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # Espera uma janela curta para agregar quem chegar em seguida
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            SEARCH_BATCH_SIZE.observe(len(batch))
+            try:
+                values = await self.store.get(path)
+                targets = [t for request_targets, _ in batch for t in request_targets]
+                indices = batch_search(values, targets).indices
+                indices = indices.tolist() if hasattr(indices, 'tolist') else list(indices)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            start = 0
+            for request_targets, future in batch:
+                if not future.done():
+                    future.set_result(indices[start:start + len(request_targets)])
+                start += len(request_targets)
+
+
+class SortService:
+    def __init__(self, data_dir='.', workers=None, max_pending=64, queue_size=1024, max_batch=256,
+                 batch_window=0.002):
+        self.store = DatasetStore(data_dir)
+        self.batcher = SearchBatcher(self.store, queue_size, max_batch, batch_window)
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        # Limite de jobs no pool (em execução + aguardando); acima disso responde 503
+        self.max_pending = max_pending
+        self.pending = 0
+        self.routes = {
+            ('POST', '/sort'): self.handle_sort,
+            ('POST', '/topk'): self.handle_top_k,
+            ('POST', '/search'): self.handle_search,
+            ('GET', '/health'): self.handle_health,
+        }
+
+    async def run_in_pool(self, endpoint, fn, *args):
+        if self.pending >= self.max_pending:
+            REQUESTS_REJECTED.labels(endpoint=endpoint).inc()
+            raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "Pool de ordenação ocupado.")
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def _numbers(self, request):
+        if 'numbers' in request:
+            return list(request['numbers'])
+        if 'path' in request:
+            values = await self.store.get(request['path'])
+            return values.tolist() if hasattr(values, 'tolist') else list(values)
+        raise ServiceError(HTTPStatus.BAD_REQUEST, "Informe 'numbers' ou 'path'.")
+
+    async def handle_sort(self, request):
+        numbers = request.get('numbers')
+        if numbers is None:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Informe 'numbers'.")
+        method = request.get('method', 'tim_sort')
+        return {'numbers': await self.run_in_pool('sort', _sort_job, method, list(numbers))}
+
+    async def handle_top_k(self, request):
+        k = int(request.get('k', 10))
+        largest = bool(request.get('largest', False))
+        if 'path' in request and 'numbers' not in request:
+            # Arquivo lido em streaming no worker, sem carregar tudo
+            path = self.store.resolve(request['path'])
+            values = await self.run_in_pool('topk', _top_k_job, None, path, k, largest)
+        else:
+            numbers = await self._numbers(request)
+            values = await self.run_in_pool('topk', _top_k_job, numbers, None, k, largest)
+        return {'values': values}
+
+    async def handle_search(self, request):
+        if 'dataset' not in request:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Informe 'dataset'.")
+        targets = request.get('targets')
+        if targets is None:
+            targets = [request['target']]
+        return {'indices': await self.batcher.search(request['dataset'], [int(t) for t in targets])}
+
+    async def handle_health(self, request):
+        return {'status': 'ok', 'pending': self.pending, 'datasets': len(self.store.datasets)}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                if length > MAX_BODY:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Corpo grande demais.'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                status, payload = await self.dispatch(method, path.split('?', 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, {'error': f"Rota desconhecida: {method} {path}"}
+        start = time.perf_counter()
+        try:
+            request = json.loads(body) if body else {}
+            return HTTPStatus.OK, await handler(request)
+        except ServiceError as exc:
+            return exc.status, {'error': str(exc)}
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            return HTTPStatus.BAD_REQUEST, {'error': str(exc)}
+        except Exception as exc:
+            logging.exception(f"Erro em {method} {path}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(exc)}
+        finally:
+            REQUEST_LATENCY.labels(endpoint=path.lstrip('/')).observe(time.perf_counter() - start)
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append("Retry-After: 1")
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode() + body)
+        await writer.drain()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(service, host='127.0.0.1', port=8080, unix_path=None):
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix_path)
+        logging.info(f"Serviço ouvindo em unix:{unix_path}")
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        logging.info(f"Serviço ouvindo em http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.batcher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço local de ordenação, top-k e busca (HTTP/JSON).")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--unix', default=None, help="caminho de um Unix socket em vez de TCP")
+    parser.add_argument('--data-dir', default='.', help="raiz permitida para datasets e arquivos")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-pending', type=int, default=64, help="jobs no pool antes de responder 503")
+    parser.add_argument('--queue-size', type=int, default=1024, help="buscas em fila por dataset antes de 503")
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--batch-window-ms', type=float, default=2.0)
+    parser.add_argument('--metrics-port', type=int, default=8000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    start_http_server(args.metrics_port)
+    service = SortService(args.data_dir, args.workers, args.max_pending, args.queue_size,
+                          args.max_batch, args.batch_window_ms / 1000)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
@@ -0,0 +1,209 @@
+import heapq
+import json
+import os
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from binary_format import read_binary, write_binary
+
+
+class SortedCollection:
+    """Lista ordenada em blocos: inserção/remoção em O(log n + load) e rank/select em O(log n).
+
+    Os blocos têm entre load/2 e 2*load elementos; maxes guarda o último valor de cada
+    bloco e uma árvore de Fenwick sobre os tamanhos dos blocos responde às posições globais.
+    """
+
+    def __init__(self, values=(), load=1000):
+        self.load = load
+        self._blocks = []
+        self._maxes = []
+        self._tree = [0]
+        self._len = 0
+        # Incrementada a cada alteração: permite memorizar o hash do conteúdo
+        self.version = 0
+        if values:
+            self._rebuild(sorted(values))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __contains__(self, value):
+        return self.find(value) != -1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Índice fora da coleção.")
+        block, offset = self._locate(index)
+        return self._blocks[block][offset]
+
+    def select(self, k):
+        """k-ésimo menor valor (base 0)."""
+        return self[k]
+
+    def rank(self, value):
+        """Quantidade de valores estritamente menores que value."""
+        return self.bisect_left(value)
+
+    def bisect_left(self, value):
+        b = bisect_left(self._maxes, value)
+        if b == len(self._blocks):
+            return self._len
+        return self._prefix(b) + bisect_left(self._blocks[b], value)
+
+    def bisect_right(self, value):
+        b = bisect_right(self._maxes, value)
+        if b == len(self._blocks):
+            return self._len
+        return self._prefix(b) + bisect_right(self._blocks[b], value)
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def find(self, value):
+        """Posição da primeira ocorrência de value, ou -1."""
+        b = bisect_left(self._maxes, value)
+        if b == len(self._blocks):
+            return -1
+        block = self._blocks[b]
+        i = bisect_left(block, value)
+        if block[i] != value:
+            return -1
+        return self._prefix(b) + i
+
+    def add(self, value):
+        if not self._blocks:
+            self._rebuild([value])
+            return
+        b = bisect_right(self._maxes, value)
+        if b == len(self._blocks):
+            b -= 1
+            self._blocks[b].append(value)
+            self._maxes[b] = value
+        else:
+            insort(self._blocks[b], value)
+        self._len += 1
+        self.version += 1
+        self._tree_add(b, 1)
+        if len(self._blocks[b]) > 2 * self.load:
+            self._split(b)
+
+    def discard(self, value):
+        b = bisect_left(self._maxes, value)
+        if b == len(self._blocks):
+            return False
+        block = self._blocks[b]
+        i = bisect_left(block, value)
+        if block[i] != value:
+            return False
+        del block[i]
+        self._len -= 1
+        self.version += 1
+        if not block:
+            del self._blocks[b]
+            del self._maxes[b]
+            self._build_tree()
+        else:
+            self._maxes[b] = block[-1]
+            self._tree_add(b, -1)
+            if len(block) < self.load // 2 and len(self._blocks) > 1:
+                self._join(b)
+        return True
+
+    def remove(self, value):
+        if not self.discard(value):
+            raise ValueError(f"{value} não está na coleção.")
+
+    def update(self, values):
+        """Intercala um lote de valores (ordenado ou não)."""
+        batch = sorted(values)
+        if not batch:
+            return
+        if len(batch) * 8 < self._len:
+            # Lote pequeno: inserções pontuais saem mais baratas que reconstruir tudo
+            for value in batch:
+                self.add(value)
+        else:
+            self._rebuild(list(heapq.merge(self, batch)))
+
+    def save(self, path, meta=None):
+        """Grava os valores no formato binário e, se houver, os metadados em <path>.json."""
+        write_binary(path, list(self))
+        if meta is not None:
+            with open(path + '.json', 'w') as f:
+                json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, path, load=1000):
+        """Retorna (coleção, metadados); os valores já estão ordenados e não são reordenados."""
+        collection = cls(load=load)
+        collection._rebuild(read_binary(path, mode='r').tolist())
+        meta = {}
+        if os.path.exists(path + '.json'):
+            with open(path + '.json', 'r') as f:
+                meta = json.load(f)
+        return collection, meta
+
+    def _rebuild(self, ordered):
+        self._blocks = [ordered[i:i + self.load] for i in range(0, len(ordered), self.load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(ordered)
+        self.version += 1
+        self._build_tree()
+
+    def _split(self, b):
+        block = self._blocks[b]
+        half = len(block) // 2
+        self._blocks[b:b + 1] = [block[:half], block[half:]]
+        self._maxes[b:b + 1] = [block[half - 1], block[-1]]
+        self._build_tree()
+
+    def _join(self, b):
+        if b == len(self._blocks) - 1:
+            b -= 1
+        merged = self._blocks[b] + self._blocks[b + 1]
+        self._blocks[b:b + 2] = [merged]
+        self._maxes[b:b + 2] = [merged[-1]]
+        if len(merged) > 2 * self.load:
+            self._split(b)
+        else:
+            self._build_tree()
+
+    def _build_tree(self):
+        # Fenwick em O(B): cada nó repassa sua soma ao pai
+        tree = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, b, delta):
+        i = b + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, b):
+        # Quantidade de elementos nos blocos [0, b)
+        total = 0
+        while b > 0:
+            total += self._tree[b]
+            b -= b & -b
+        return total
+
+    def _locate(self, index):
+        # Descida na Fenwick: último bloco cujo prefixo ainda cabe em index
+        pos = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= index:
+                pos = nxt
+                index -= self._tree[nxt]
+            step >>= 1
+        return pos, index
@@ -0,0 +1,131 @@
+import hashlib
+import io
+import json
+import os
+from array import array
+from binary_format import HEADER, TYPECODE, read_header, write_binary
+
+CACHE_DIR = os.path.join('results', 'sorted_cache')
+INDEX_FILE = 'index.json'
+HASH_BLOCK = 1 << 20
+
+
+def _digest_file(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    """Hash do conteúdo bruto do arquivo de entrada: dispensa até o parse dos números."""
+    return f"{_digest_file(path)}-{os.path.getsize(path)}"
+
+
+def cache_key(fingerprint, strategy=None):
+    """Números inteiros ordenados não dependem da estratégia, então por padrão a chave é só o
+    conteúdo e qualquer estratégia aproveita o acerto; passe strategy quando a saída depender
+    dela (ex.: ordenação instável de registros).
+    """
+    return fingerprint if strategy is None else f"{fingerprint}:{strategy}"
+
+
+class SortedOutputCache:
+    """Saídas ordenadas em formato binário, endereçadas pelo conteúdo da entrada.
+
+    O índice guarda tamanho e hash de cada arquivo (conferidos em toda leitura) e a ordem de
+    uso; ao passar de max_bytes, as entradas usadas há mais tempo são removidas.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.entries = {}
+        self.clock = 0
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            self.entries = index['entries']
+            self.clock = index['clock']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+    def get(self, key):
+        """Devolve um array('q') ordenado, ou None se não houver entrada íntegra."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.directory, entry['file'])
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            self._drop(key)
+            return None
+        if len(payload) != entry['size'] or hashlib.blake2b(payload, digest_size=16).hexdigest() != entry['digest']:
+            # Arquivo truncado ou corrompido: descarta em vez de devolver dados errados
+            self._drop(key)
+            return None
+        count = read_header(io.BytesIO(payload))
+        numbers = array(TYPECODE)
+        numbers.frombytes(payload[HEADER.size:HEADER.size + count * numbers.itemsize])
+        self._touch(key)
+        self._save_index()
+        return numbers
+
+    def put(self, key, sorted_numbers, strategy=None):
+        file_name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.bin'
+        path = os.path.join(self.directory, file_name)
+        tmp_path = path + '.tmp'
+        try:
+            write_binary(tmp_path, sorted_numbers)
+        except OverflowError:
+            # Fora de int64 não cabe no formato binário; a saída só não fica em cache
+            os.remove(tmp_path)
+            return False
+        size = os.path.getsize(tmp_path)
+        if size > self.max_bytes:
+            os.remove(tmp_path)
+            return False
+        digest = _digest_file(tmp_path)
+        os.replace(tmp_path, path)
+        self.entries[key] = {'file': file_name, 'size': size, 'digest': digest, 'strategy': strategy}
+        self._touch(key)
+        self._evict(keep=key)
+        self._save_index()
+        return True
+
+    def total_bytes(self):
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def _touch(self, key):
+        self.clock += 1
+        self.entries[key]['last_used'] = self.clock
+
+    def _evict(self, keep):
+        by_age = sorted(self.entries, key=lambda k: self.entries[k]['last_used'])
+        total = self.total_bytes()
+        for key in by_age:
+            if total <= self.max_bytes:
+                break
+            if key != keep:
+                total -= self.entries[key]['size']
+                self._drop(key, save=False)
+
+    def _drop(self, key, save=True):
+        entry = self.entries.pop(key)
+        try:
+            os.remove(os.path.join(self.directory, entry['file']))
+        except FileNotFoundError:
+            pass
+        if save:
+            self._save_index()
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'entries': self.entries, 'clock': self.clock}, f)
+        os.replace(tmp_path, self.index_path)
@@ -0,0 +1,143 @@
+import argparse
+import csv
+import json
+import logging
+import math
+import time
+from prometheus_client import start_http_server, Gauge
+
+import sort_all
+from distributions import DISTRIBUTIONS, generate_distribution, geometric_sizes
+
+#########################
+# Métricas da matriz de benchmark
+#########################
+MATRIX_DURATION = Gauge(
+    "algorithm_matrix_duration_seconds",
+    "Tempo mediano em segundos por algoritmo, tamanho e distribuição",
+    ["algorithm", "size", "distribution"],
+)
+GROWTH_EXPONENT = Gauge(
+    "algorithm_growth_exponent",
+    "Expoente empírico k em tempo ~ n^k, ajustado por mínimos quadrados em log-log",
+    ["algorithm", "distribution"],
+)
+
+
+def fit_growth_exponent(points):
+    """Inclinação da reta log(t) x log(n); None com menos de dois tamanhos."""
+    points = [(n, t) for n, t in points if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+
+
+def run_matrix(names, sizes, distributions, repetitions=3, max_seconds=10.0, seed=0):
+    """Varre tamanhos x distribuições para cada algoritmo.
+
+    Quando uma medição passa de max_seconds (ou falha), os tamanhos maiores
+    daquela combinação são pulados.
+    """
+    rows = []
+    for distribution in distributions:
+        datasets = {size: generate_distribution(distribution, size, seed=seed) for size in sizes}
+        for name in names:
+            for size in sizes:
+                row = {"algorithm": name, "distribution": distribution, "size": size,
+                       "seconds": None, "iqr_seconds": None, "status": "ok"}
+                try:
+                    # Parâmetros do perfil de autotune.py para este tamanho e distribuição
+                    strategy = sort_all.benchmark_strategy(name, datasets[size])
+                    stats = sort_all.benchmark_sort(strategy, datasets[size], repetitions,
+                                                    max_seconds=max_seconds)
+                    row["seconds"] = stats.median
+                    row["iqr_seconds"] = stats.iqr
+                except (RecursionError, MemoryError, OverflowError, IndexError) as exc:
+                    # Ex.: RecursionError do QuickSort em entrada já ordenada
+                    row["status"] = type(exc).__name__
+                rows.append(row)
+                if row["seconds"] is not None:
+                    MATRIX_DURATION.labels(algorithm=name, size=str(size), distribution=distribution).set(row["seconds"])
+                    logging.info(f"{name} [{distribution}] n={size}: {row['seconds']*1000:.2f} ms")
+                if row["status"] != "ok" or row["seconds"] > max_seconds:
+                    break
+    return rows
+
+
+def growth_table(rows):
+    grouped = {}
+    for row in rows:
+        if row["seconds"] is not None:
+            grouped.setdefault((row["algorithm"], row["distribution"]), []).append((row["size"], row["seconds"]))
+    exponents = {}
+    for (name, distribution), points in grouped.items():
+        exponent = fit_growth_exponent(points)
+        exponents[(name, distribution)] = exponent
+        if exponent is not None:
+            GROWTH_EXPONENT.labels(algorithm=name, distribution=distribution).set(exponent)
+    return exponents
+
+
+def write_results(path, rows, exponents):
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({
+                "rows": rows,
+                "growth_exponents": [
+                    {"algorithm": name, "distribution": distribution, "exponent": exponent}
+                    for (name, distribution), exponent in exponents.items()
+                ],
+            }, f, indent=2)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["algorithm", "distribution", "size", "seconds", "iqr_seconds", "status",
+                                               "growth_exponent"])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(dict(row, growth_exponent=exponents.get((row["algorithm"], row["distribution"]))))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Matriz de benchmark: tamanhos x distribuições.")
+    parser.add_argument("--min-size", type=float, default=1e3)
+    parser.add_argument("--max-size", type=float, default=1e7)
+    parser.add_argument("--factor", type=float, default=10)
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", default=None)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=10.0,
+                        help="não cresce o tamanho depois de uma medição acima desse tempo")
+    parser.add_argument("--output", default="benchmark_matrix.csv", help=".csv ou .json")
+    parser.add_argument("--serve", action="store_true", help="mantém o endpoint de métricas na porta 8000")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sort_all.init_logging()
+    if args.serve:
+        start_http_server(8000)
+    names = args.algorithms or list(sort_all.build_strategies())
+    sizes = geometric_sizes(int(args.min_size), int(args.max_size), args.factor)
+    rows = run_matrix(names, sizes, args.distributions, args.repetitions, args.max_seconds)
+    exponents = growth_table(rows)
+    write_results(args.output, rows, exponents)
+    for (name, distribution), exponent in sorted(exponents.items()):
+        label = f"{exponent:.2f}" if exponent is not None else "n/d"
+        print(f"{name} [{distribution}]: expoente de crescimento = {label}")
+    print(f"Tabela salva em {args.output}.")
+    if args.serve:
+        print("Aguardando... Pressione Ctrl+C para encerrar.")
+        while True:
+            time.sleep(5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import argparse
+import csv
+import json
+import logging
+import math
+import multiprocessing
+import time
+from prometheus_client import start_http_server, Gauge
+
+import sort_all
+from distributions import DISTRIBUTIONS, generate_distribution, geometric_sizes
+from algorithms.registry import specs
+
+#########################
+# Métricas do agendador
+#########################
+SCHEDULED_DURATION = Gauge(
+    "algorithm_scheduled_duration_seconds",
+    "Tempo mediano por algoritmo e tamanho; extrapolated=1 quando estimado pela curva ajustada",
+    ["algorithm", "size", "distribution", "extrapolated"],
+)
+
+# Curvas candidatas t = c * f(n)
+COMPLEXITY_MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n^1.5": lambda n: n ** 1.5,
+    "n^2": lambda n: n ** 2,
+}
+# Usadas enquanto só há um ponto medido (não dá para escolher a curva pelos dados)
+EXPECTED_COMPLEXITY = {spec.label: spec.complexity for spec in specs()}
+READY_TIMEOUT = 600.0
+
+
+def fit_complexity(points, expected="n log n"):
+    """Escolhe a curva com menor erro quadrático em log e ajusta a constante.
+
+    Retorna (nome do modelo, constante c); com um único ponto usa o modelo esperado.
+    """
+    points = [(n, t) for n, t in points if n > 1 and t > 0]
+    if not points:
+        return None, None
+    candidates = COMPLEXITY_MODELS if len(points) > 1 else {expected: COMPLEXITY_MODELS[expected]}
+    best = None
+    for name, model in candidates.items():
+        logs = [math.log(t) - math.log(model(n)) for n, t in points]
+        log_c = sum(logs) / len(logs)
+        error = sum((value - log_c) ** 2 for value in logs)
+        if best is None or error < best[0]:
+            best = (error, name, math.exp(log_c))
+    return best[1], best[2]
+
+
+def extrapolate(model, constant, size):
+    return constant * COMPLEXITY_MODELS[model](size)
+
+
+def _worker(conn, name, size, distribution, seed, repetitions, max_seconds):
+    # Roda em um processo separado, que o agendador pode encerrar ao estourar o orçamento
+    try:
+        data = generate_distribution(distribution, size, seed=seed)
+        strategy = sort_all.benchmark_strategy(name, data)
+        conn.send(("ready", None))
+        stats = sort_all.benchmark_sort(strategy, data, repetitions, max_repetitions=repetitions,
+                                        max_seconds=max_seconds)
+        conn.send(("ok", stats.median))
+    except Exception as exc:
+        conn.send((type(exc).__name__, None))
+    finally:
+        conn.close()
+
+
+def run_with_budget(name, size, distribution, seed, repetitions, budget):
+    """Mede em subprocesso; devolve (status, segundos). A geração dos dados não conta no orçamento."""
+    parent, child = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_worker, args=(child, name, size, distribution, seed, repetitions, budget / 2), daemon=True
+    )
+    process.start()
+    child.close()
+    try:
+        if not parent.poll(READY_TIMEOUT):
+            return "timeout", None
+        status, _ = parent.recv()
+        if status != "ready":
+            return status, None
+        if not parent.poll(budget):
+            return "timeout", None
+        return parent.recv()
+    except EOFError:
+        return "crashed", None
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        parent.close()
+
+
+def schedule(names, sizes, distribution="uniform", budget=10.0, repetitions=3, seed=0):
+    """Para cada algoritmo, cresce o tamanho enquanto a previsão couber no orçamento por tamanho.
+
+    Tamanhos que não cabem (ou que estouraram o orçamento) recebem o tempo previsto pela
+    curva ajustada aos pontos medidos, com status 'extrapolated'.
+    """
+    rows = []
+    for name in names:
+        measured = []
+        stop = False
+        for size in sizes:
+            row = {"algorithm": name, "distribution": distribution, "size": size,
+                   "seconds": None, "status": None, "model": None}
+            model, constant = fit_complexity(measured, EXPECTED_COMPLEXITY.get(name, "n log n"))
+            # Aquecimento + repetições precisam caber no orçamento
+            if not stop and model is not None and extrapolate(model, constant, size) * (repetitions + 1) > budget:
+                stop = True
+            if stop:
+                if model is None:
+                    row["status"] = "skipped"
+                else:
+                    row.update(seconds=extrapolate(model, constant, size), status="extrapolated", model=model)
+            else:
+                status, seconds = run_with_budget(name, size, distribution, seed, repetitions, budget)
+                if status == "ok":
+                    row.update(seconds=seconds, status="measured")
+                    measured.append((size, seconds))
+                else:
+                    # Estourou o orçamento ou falhou: os tamanhos seguintes só são estimados
+                    row["status"] = status
+                    stop = True
+                logging.info(f"{name} [{distribution}] n={size}: {row['status']}"
+                             + (f" {seconds*1000:.2f} ms" if status == "ok" else ""))
+            if row["seconds"] is not None:
+                SCHEDULED_DURATION.labels(
+                    algorithm=name, size=str(size), distribution=distribution,
+                    extrapolated=str(int(row["status"] == "extrapolated")),
+                ).set(row["seconds"])
+            rows.append(row)
+        # O modelo final (com todos os pontos) vale para as linhas medidas também
+        model, _ = fit_complexity(measured, EXPECTED_COMPLEXITY.get(name, "n log n"))
+        for row in rows:
+            if row["algorithm"] == name and row["status"] == "measured":
+                row["model"] = model
+    return rows
+
+
+def format_seconds(seconds):
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f} h"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1000:.2f} ms"
+
+
+def write_results(path, rows):
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({"rows": rows}, f, indent=2)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["algorithm", "distribution", "size", "seconds", "status", "model"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark com orçamento de tempo por tamanho e extrapolação.")
+    parser.add_argument("--min-size", type=float, default=1e3)
+    parser.add_argument("--max-size", type=float, default=1e6)
+    parser.add_argument("--factor", type=float, default=10)
+    parser.add_argument("--distribution", default="uniform", choices=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", default=None)
+    parser.add_argument("--budget", type=float, default=10.0, help="segundos por algoritmo e tamanho")
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_schedule.csv", help=".csv ou .json")
+    parser.add_argument("--serve", action="store_true", help="mantém o endpoint de métricas na porta 8000")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sort_all.init_logging()
+    if args.serve:
+        start_http_server(8000)
+    names = args.algorithms or list(sort_all.build_strategies())
+    sizes = geometric_sizes(int(args.min_size), int(args.max_size), args.factor)
+    rows = schedule(names, sizes, args.distribution, args.budget, args.repetitions)
+    write_results(args.output, rows)
+    for row in rows:
+        if row["seconds"] is None:
+            print(f"{row['algorithm']} n={row['size']}: {row['status']}")
+            continue
+        mark = f" (extrapolado, ~{row['model']})" if row["status"] == "extrapolated" else ""
+        print(f"{row['algorithm']} n={row['size']}: {format_seconds(row['seconds'])}{mark}")
+    print(f"Tabela salva em {args.output}.")
+    if args.serve:
+        print("Aguardando... Pressione Ctrl+C para encerrar.")
+        while True:
+            time.sleep(5)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,92 @@
 from abc import ABC, abstractmethod
-import copy
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import multiprocessing
 import random
+import sys
 import time
 import os
 import logging
-from prometheus_client import start_http_server, Summary, Counter
+import math
+import tracemalloc
 
-#########################
-# Configuração de Logging
-#########################
-logging.basicConfig(
-    filename="python_app.log",  # Arquivo onde os logs serão gravados
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Módulos compartilhados com o pacote SortAlgorithms (geradores de dados etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "SortAlgorithms"))
+from distributions import generate_distribution
+from algorithms.registry import create_strategy, get_spec, specs
+from algorithms.shell_sort import GAP_SEQUENCES
+from timing_harness import (
+    TimingStats, measure, time_once_ns, save_baseline, load_baseline, compare_to_baseline,
+    MIN_BASELINE_SAMPLES,
 )
-logging.info("Iniciando o benchmark de algoritmos de ordenação.")
 
 #########################
-# Configuração do Prometheus
+# Configuração de Logging e Prometheus
 #########################
-ALGORITHM_DURATION = Summary(
-    "algorithm_duration_seconds", "Tempo gasto em segundos para ordenar", ["algorithm"]
-)
-ALGORITHM_COMPARISONS = Counter(
-    "algorithm_comparisons_total", "Total de comparações realizadas", ["algorithm"]
-)
-ALGORITHM_SWAPS = Counter(
-    "algorithm_swaps_total", "Total de trocas realizadas", ["algorithm"]
-)
+# Nada disso roda no import: workers e scripts que só ordenam não pagam pelo
+# prometheus_client nem gravam no log; main() inicializa os dois.
+ALGORITHM_DURATION = None
+ALGORITHM_INSTRUMENTED_DURATION = None
+ALGORITHM_COMPARISONS = None
+ALGORITHM_SWAPS = None
+ALGORITHM_PEAK_MEMORY = None
+ALGORITHM_RETAINED_BLOCKS = None
+ALGORITHM_RSS_DELTA = None
+
+
+def init_logging(filename="python_app.log"):
+    logging.basicConfig(
+        filename=filename,  # Arquivo onde os logs serão gravados
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    logging.info("Iniciando o benchmark de algoritmos de ordenação.")
+
+
+def init_metrics():
+    global ALGORITHM_DURATION, ALGORITHM_INSTRUMENTED_DURATION, ALGORITHM_COMPARISONS, ALGORITHM_SWAPS
+    global ALGORITHM_PEAK_MEMORY, ALGORITHM_RETAINED_BLOCKS, ALGORITHM_RSS_DELTA
+    if ALGORITHM_DURATION is not None:
+        return
+    from prometheus_client import Summary, Counter, Gauge
+
+    ALGORITHM_DURATION = Summary(
+        "algorithm_duration_seconds", "Tempo gasto em segundos para ordenar", ["algorithm"]
+    )
+    ALGORITHM_INSTRUMENTED_DURATION = Summary(
+        "algorithm_instrumented_duration_seconds",
+        "Tempo gasto em segundos na passada instrumentada (com contadores)",
+        ["algorithm"],
+    )
+    ALGORITHM_COMPARISONS = Counter(
+        "algorithm_comparisons_total", "Total de comparações realizadas", ["algorithm"]
+    )
+    ALGORITHM_SWAPS = Counter(
+        "algorithm_swaps_total", "Total de trocas realizadas", ["algorithm"]
+    )
+    ALGORITHM_PEAK_MEMORY = Gauge(
+        "algorithm_peak_memory_bytes",
+        "Pico de memória rastreada pelo tracemalloc durante uma ordenação",
+        ["algorithm"],
+    )
+    # Não conta alocações feitas e liberadas durante a ordenação (ex.: fatias do MergeSort);
+    # para memória temporária, veja algorithm_peak_memory_bytes
+    ALGORITHM_RETAINED_BLOCKS = Gauge(
+        "algorithm_retained_blocks",
+        "Blocos de memória alocados pela ordenação que continuam vivos ao final (inclui o resultado)",
+        ["algorithm"],
+    )
+    ALGORITHM_RSS_DELTA = Gauge(
+        "algorithm_rss_delta_bytes",
+        "Variação do RSS do processo durante uma ordenação",
+        ["algorithm"],
+    )
 
 
 #########################
@@ -43,13 +102,19 @@ class SortResult:
 class SortStrategy(ABC):
     @abstractmethod
     def sort(self, data):
+        """Modo instrumentado: conta comparações e trocas e retorna um SortResult."""
+        pass
+
+    @abstractmethod
+    def sort_timed(self, data):
+        """Modo enxuto para cronometragem: sem contadores nem logging, retorna a lista ordenada."""
         pass
 
 
 class BubbleSort(SortStrategy):
     def sort(self, data):
         logging.info("Executando BubbleSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         n = len(arr)
         comparisons = 0
         swaps = 0
@@ -61,11 +126,20 @@ class BubbleSort(SortStrategy):
                     swaps += 1
         return SortResult(arr, comparisons, swaps)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        n = len(arr)
+        for i in range(n):
+            for j in range(0, n - i - 1):
+                if arr[j] > arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        return arr
+
 
 class InsertionSort(SortStrategy):
     def sort(self, data):
         logging.info("Executando InsertionSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         comparisons = 0
         swaps = 0
         for i in range(1, len(arr)):
@@ -83,11 +157,26 @@ class InsertionSort(SortStrategy):
             swaps += 1
         return SortResult(arr, comparisons, swaps)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        for i in range(1, len(arr)):
+            key = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+        return arr
+
 
 class QuickSort(SortStrategy):
+    def __init__(self, cutoff=0):
+        # Partições com até cutoff elementos vão para insertion sort (0 = quicksort puro)
+        self.cutoff = cutoff
+
     def sort(self, data):
         logging.info("Executando QuickSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         self.comparisons = 0
         self.swaps = 0
         self._quick_sort(arr, 0, len(arr) - 1)
@@ -95,6 +184,9 @@ class QuickSort(SortStrategy):
 
     def _quick_sort(self, arr, low, high):
         if low < high:
+            if high - low < self.cutoff:
+                self._insertion_sort(arr, low, high)
+                return
             pi = self._partition(arr, low, high)
             self._quick_sort(arr, low, pi - 1)
             self._quick_sort(arr, pi + 1, high)
@@ -112,11 +204,52 @@ class QuickSort(SortStrategy):
         self.swaps += 1
         return i + 1
 
+    def _insertion_sort(self, arr, low, high):
+        for i in range(low + 1, high + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= low:
+                self.comparisons += 1
+                if arr[j] > key:
+                    arr[j + 1] = arr[j]
+                    self.swaps += 1
+                    j -= 1
+                else:
+                    break
+            arr[j + 1] = key
+            self.swaps += 1
+
+    def sort_timed(self, data):
+        arr = list(data)
+        self._quick_sort_timed(arr, 0, len(arr) - 1)
+        return arr
+
+    def _quick_sort_timed(self, arr, low, high):
+        if low < high:
+            if high - low < self.cutoff:
+                for i in range(low + 1, high + 1):
+                    key = arr[i]
+                    j = i - 1
+                    while j >= low and arr[j] > key:
+                        arr[j + 1] = arr[j]
+                        j -= 1
+                    arr[j + 1] = key
+                return
+            pivot = arr[high]
+            i = low - 1
+            for j in range(low, high):
+                if arr[j] < pivot:
+                    i += 1
+                    arr[i], arr[j] = arr[j], arr[i]
+            arr[i + 1], arr[high] = arr[high], arr[i + 1]
+            self._quick_sort_timed(arr, low, i)
+            self._quick_sort_timed(arr, i + 2, high)
+
 
 class SelectionSort(SortStrategy):
     def sort(self, data):
         logging.info("Executando SelectionSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         n = len(arr)
         comparisons = 0
         swaps = 0
@@ -131,16 +264,97 @@ class SelectionSort(SortStrategy):
                 swaps += 1
         return SortResult(arr, comparisons, swaps)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        n = len(arr)
+        for i in range(n):
+            min_index = i
+            for j in range(i + 1, n):
+                if arr[j] < arr[min_index]:
+                    min_index = j
+            if min_index != i:
+                arr[i], arr[min_index] = arr[min_index], arr[i]
+        return arr
+
+
+def merge_timed(arr, left, mid, right):
+    L = arr[left:mid]
+    R = arr[mid:right]
+    i = 0
+    j = 0
+    k = left
+    len_l = len(L)
+    len_r = len(R)
+    while i < len_l and j < len_r:
+        if L[i] <= R[j]:
+            arr[k] = L[i]
+            i += 1
+        else:
+            arr[k] = R[j]
+            j += 1
+        k += 1
+    if i < len_l:
+        arr[k:right] = L[i:]
+    elif j < len_r:
+        arr[k:right] = R[j:]
+
 
 class MergeSort(SortStrategy):
+    def __init__(self, bottom_up=False):
+        # bottom_up: versão iterativa com um único buffer auxiliar (sem fatiar a cada merge)
+        self.bottom_up = bottom_up
+
     def sort(self, data):
-        logging.info("Executando MergeSort.")
-        arr = copy.deepcopy(data)
+        logging.info("Executando MergeSort%s." % (" (bottom-up)" if self.bottom_up else ""))
+        arr = list(data)
         self.comparisons = 0
         self.swaps = 0
-        self._merge_sort(arr, 0, len(arr))
+        if self.bottom_up:
+            arr = self._bottom_up(arr)
+        else:
+            self._merge_sort(arr, 0, len(arr))
         return SortResult(arr, self.comparisons, self.swaps)
 
+    def _bottom_up(self, arr):
+        n = len(arr)
+        src = arr
+        dst = arr[:]
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                if mid < hi:
+                    self.comparisons += 1
+                if mid >= hi or src[mid - 1] <= src[mid]:
+                    dst[lo:hi] = src[lo:hi]
+                    self.swaps += hi - lo
+                    continue
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    self.comparisons += 1
+                    if src[i] <= src[j]:
+                        dst[k] = src[i]
+                        i += 1
+                    else:
+                        dst[k] = src[j]
+                        j += 1
+                    self.swaps += 1
+                    k += 1
+                while i < mid:
+                    dst[k] = src[i]
+                    i += 1
+                    k += 1
+                    self.swaps += 1
+                while j < hi:
+                    dst[k] = src[j]
+                    j += 1
+                    k += 1
+                    self.swaps += 1
+            src, dst = dst, src
+            width *= 2
+        return src
+
     def _merge_sort(self, arr, left, right):
         if right - left > 1:
             mid = (left + right) // 2
@@ -175,14 +389,60 @@ class MergeSort(SortStrategy):
             k += 1
             self.swaps += 1
 
+    def sort_timed(self, data):
+        arr = list(data)
+        if self.bottom_up:
+            return self._bottom_up_timed(arr)
+        self._merge_sort_timed(arr, 0, len(arr))
+        return arr
+
+    def _bottom_up_timed(self, arr):
+        n = len(arr)
+        src = arr
+        dst = arr[:]
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                if mid >= hi or src[mid - 1] <= src[mid]:
+                    dst[lo:hi] = src[lo:hi]
+                    continue
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    if src[i] <= src[j]:
+                        dst[k] = src[i]
+                        i += 1
+                    else:
+                        dst[k] = src[j]
+                        j += 1
+                    k += 1
+                if i < mid:
+                    dst[k:hi] = src[i:mid]
+                elif j < hi:
+                    dst[k:hi] = src[j:hi]
+            src, dst = dst, src
+            width *= 2
+        return src
+
+    def _merge_sort_timed(self, arr, left, right):
+        if right - left > 1:
+            mid = (left + right) // 2
+            self._merge_sort_timed(arr, left, mid)
+            self._merge_sort_timed(arr, mid, right)
+            merge_timed(arr, left, mid, right)
+
 
 class TimSort(SortStrategy):
+    def __init__(self, minrun=32):
+        self.minrun = minrun
+
     def sort(self, data):
         logging.info("Executando TimSort (simplificado).")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         self.comparisons = 0
         self.swaps = 0
-        minrun = 32
+        minrun = self.minrun
         n = len(arr)
         for start in range(0, n, minrun):
             end = min(start + minrun, n)
@@ -238,11 +498,33 @@ class TimSort(SortStrategy):
             k += 1
             self.swaps += 1
 
+    def sort_timed(self, data):
+        arr = list(data)
+        minrun = self.minrun
+        n = len(arr)
+        for start in range(0, n, minrun):
+            end = min(start + minrun, n)
+            for i in range(start + 1, end):
+                key = arr[i]
+                j = i - 1
+                while j >= start and arr[j] > key:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                arr[j + 1] = key
+        size = minrun
+        while size < n:
+            for left in range(0, n, 2 * size):
+                mid = min(n, left + size)
+                right = min(n, left + 2 * size)
+                merge_timed(arr, left, mid, right)
+            size *= 2
+        return arr
+
 
 class HeapSort(SortStrategy):
     def sort(self, data):
         logging.info("Executando HeapSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         n = len(arr)
         self.comparisons = 0
         self.swaps = 0
@@ -271,54 +553,113 @@ class HeapSort(SortStrategy):
             self.swaps += 1
             self._heapify(arr, heap_size, largest)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        n = len(arr)
+        for i in range(n // 2 - 1, -1, -1):
+            self._heapify_timed(arr, n, i)
+        for i in range(n - 1, 0, -1):
+            arr[0], arr[i] = arr[i], arr[0]
+            self._heapify_timed(arr, i, 0)
+        return arr
+
+    def _heapify_timed(self, arr, heap_size, root_index):
+        while True:
+            largest = root_index
+            left = 2 * root_index + 1
+            right = left + 1
+            if left < heap_size and arr[left] > arr[largest]:
+                largest = left
+            if right < heap_size and arr[right] > arr[largest]:
+                largest = right
+            if largest == root_index:
+                return
+            arr[root_index], arr[largest] = arr[largest], arr[root_index]
+            root_index = largest
+
 
 class CountingSort(SortStrategy):
+    def __init__(self, max_dense_ratio=8, dense_min_range=1024):
+        # Acima de max_dense_ratio * n de amplitude, a contagem vai para um dict
+        self.max_dense_ratio = max_dense_ratio
+        self.dense_min_range = dense_min_range
+
+    def _count(self, arr):
+        # Devolve (valores em ordem, frequências), contando sobre [min, max]
+        min_val = min(arr)
+        max_val = max(arr)
+        if max_val - min_val + 1 <= max(self.max_dense_ratio * len(arr), self.dense_min_range):
+            count = [0] * (max_val - min_val + 1)
+            for num in arr:
+                count[num - min_val] += 1
+            return range(min_val, max_val + 1), count
+        sparse = {}
+        for num in arr:
+            sparse[num] = sparse.get(num, 0) + 1
+        values = sorted(sparse)
+        return values, [sparse[value] for value in values]
+
     def sort(self, data):
         logging.info("Executando CountingSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         if not arr:
             return SortResult(arr, 0, 0)
-        max_val = max(arr)
-        count = [0] * (max_val + 1)
-        for num in arr:
-            count[num] += 1
+        values, count = self._count(arr)
         self.comparisons = 0
         self.swaps = 0
         index = 0
-        for num, freq in enumerate(count):
+        for num, freq in zip(values, count):
             for _ in range(freq):
                 arr[index] = num
                 self.swaps += 1
                 index += 1
         return SortResult(arr, self.comparisons, self.swaps)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        if not arr:
+            return arr
+        values, count = self._count(arr)
+        index = 0
+        for num, freq in zip(values, count):
+            if freq:
+                arr[index:index + freq] = [num] * freq
+                index += freq
+        return arr
+
 
 class RadixSort(SortStrategy):
+    # LSD de base 2^base_bits sobre (valor - mínimo): aceita negativos e pula
+    # as passadas em que todos os números caem no mesmo balde
+    def __init__(self, base_bits=8):
+        self.base_bits = base_bits
+
     def sort(self, data):
         logging.info("Executando RadixSort.")
-        arr = copy.deepcopy(data)
-        if not arr:
-            return SortResult(arr, 0, 0)
-        max_val = max(arr)
-        exp = 1
+        arr = list(data)
         self.comparisons = 0  # Não utiliza comparações diretas
         self.swaps = 0  # Movimentações contabilizadas
-        while max_val // exp > 0:
-            self._counting_sort_by_digit(arr, exp)
-            exp *= 10
+        if len(arr) < 2:
+            return SortResult(arr, 0, 0)
+        min_val = min(arr)
+        for shift in range(0, (max(arr) - min_val).bit_length(), self.base_bits):
+            self._counting_sort_by_digit(arr, shift, min_val)
         return SortResult(arr, self.comparisons, self.swaps)
 
-    def _counting_sort_by_digit(self, arr, exp):
+    def _counting_sort_by_digit(self, arr, shift, min_val):
         n = len(arr)
+        mask = (1 << self.base_bits) - 1
         output = [0] * n
-        count = [0] * 10
+        count = [0] * (mask + 1)
         for i in range(n):
-            index = (arr[i] // exp) % 10
+            index = ((arr[i] - min_val) >> shift) & mask
             count[index] += 1
-        for i in range(1, 10):
+        if count[((arr[0] - min_val) >> shift) & mask] == n:
+            return  # passada trivial
+        for i in range(1, mask + 1):
             count[i] += count[i - 1]
         for i in range(n - 1, -1, -1):
-            index = (arr[i] // exp) % 10
+            index = ((arr[i] - min_val) >> shift) & mask
             output[count[index] - 1] = arr[i]
             count[index] -= 1
             self.swaps += 1
@@ -326,16 +667,36 @@ class RadixSort(SortStrategy):
             arr[i] = output[i]
             self.swaps += 1
 
+    def sort_timed(self, data):
+        arr = list(data)
+        if len(arr) < 2:
+            return arr
+        min_val = min(arr)
+        mask = (1 << self.base_bits) - 1
+        for shift in range(0, (max(arr) - min_val).bit_length(), self.base_bits):
+            buckets = [[] for _ in range(mask + 1)]
+            for num in arr:
+                buckets[((num - min_val) >> shift) & mask].append(num)
+            if any(len(bucket) == len(arr) for bucket in buckets):
+                continue
+            arr = [num for bucket in buckets for num in bucket]
+        return arr
+
 
 class ShellSort(SortStrategy):
+    def __init__(self, gaps='shell'):
+        # Nome de uma sequência de algorithms.shell_sort: shell, ciura, sedgewick ou tokuda
+        if gaps not in GAP_SEQUENCES:
+            raise ValueError(f"Sequência de gaps desconhecida: {gaps}")
+        self.gaps = gaps
+
     def sort(self, data):
         logging.info("Executando ShellSort.")
-        arr = copy.deepcopy(data)
+        arr = list(data)
         n = len(arr)
         comparisons = 0
         swaps = 0
-        gap = n // 2
-        while gap > 0:
+        for gap in GAP_SEQUENCES[self.gaps](n):
             for i in range(gap, n):
                 temp = arr[i]
                 j = i
@@ -349,18 +710,449 @@ class ShellSort(SortStrategy):
                         break
                 arr[j] = temp
                 swaps += 1
-            gap //= 2
         return SortResult(arr, comparisons, swaps)
 
+    def sort_timed(self, data):
+        arr = list(data)
+        n = len(arr)
+        for gap in GAP_SEQUENCES[self.gaps](n):
+            for i in range(gap, n):
+                temp = arr[i]
+                j = i
+                while j >= gap and arr[j - gap] > temp:
+                    arr[j] = arr[j - gap]
+                    j -= gap
+                arr[j] = temp
+        return arr
+
+
+class IntroSort(SortStrategy):
+    # Quicksort híbrido: mediana de três/ninther, partição em três vias,
+    # insertion sort abaixo do cutoff, heapsort após 2·log n níveis e
+    # detecção de partições já ordenadas ou invertidas
+    cutoff = 16
+    ninther_threshold = 128
+
+    def sort(self, data):
+        logging.info("Executando IntroSort.")
+        arr = list(data)
+        self.comparisons = 0
+        self.swaps = 0
+        if len(arr) > 1:
+            self._intro_sort(arr, 0, len(arr), 2 * len(arr).bit_length())
+        return SortResult(arr, self.comparisons, self.swaps)
+
+    def _intro_sort(self, arr, lo, hi, depth):
+        while hi - lo > self.cutoff:
+            if depth == 0:
+                self._heap_sort(arr, lo, hi)
+                return
+            if self._presorted(arr, lo, hi):
+                return
+            depth -= 1
+            lt, gt = self._partition(arr, lo, hi, self._choose_pivot(arr, lo, hi))
+            if lt - lo < hi - gt:
+                self._intro_sort(arr, lo, lt, depth)
+                lo = gt
+            else:
+                self._intro_sort(arr, gt, hi, depth)
+                hi = lt
+        self._insertion_sort(arr, lo, hi)
+
+    def _presorted(self, arr, lo, hi):
+        i = lo + 1
+        while i < hi:
+            self.comparisons += 1
+            if arr[i - 1] > arr[i]:
+                break
+            i += 1
+        if i == hi:
+            return True
+        if i == lo + 1:
+            while i < hi:
+                self.comparisons += 1
+                if arr[i - 1] < arr[i]:
+                    break
+                i += 1
+            if i == hi:
+                arr[lo:hi] = arr[lo:hi][::-1]
+                self.swaps += (hi - lo) // 2
+                return True
+        return False
+
+    def _choose_pivot(self, arr, lo, hi):
+        mid = (lo + hi) // 2
+        if hi - lo < self.ninther_threshold:
+            return self._median_of_three(arr, lo, mid, hi - 1)
+        step = (hi - lo) // 8
+        return self._median_of_three(
+            arr,
+            self._median_of_three(arr, lo, lo + step, lo + 2 * step),
+            self._median_of_three(arr, mid - step, mid, mid + step),
+            self._median_of_three(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1),
+        )
+
+    def _median_of_three(self, arr, a, b, c):
+        self.comparisons += 2
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            self.comparisons += 1
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        self.comparisons += 1
+        return c if arr[b] < arr[c] else b
+
+    def _partition(self, arr, lo, hi, pivot_index):
+        pivot = arr[pivot_index]
+        lt = lo
+        i = lo
+        gt = hi
+        while i < gt:
+            value = arr[i]
+            self.comparisons += 1
+            if value < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                self.swaps += 1
+                lt += 1
+                i += 1
+            else:
+                self.comparisons += 1
+                if value > pivot:
+                    gt -= 1
+                    arr[i], arr[gt] = arr[gt], value
+                    self.swaps += 1
+                else:
+                    i += 1
+        return lt, gt
+
+    def _insertion_sort(self, arr, lo, hi):
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo:
+                self.comparisons += 1
+                if arr[j] > key:
+                    arr[j + 1] = arr[j]
+                    self.swaps += 1
+                    j -= 1
+                else:
+                    break
+            arr[j + 1] = key
+            self.swaps += 1
+
+    def _heap_sort(self, arr, lo, hi):
+        n = hi - lo
+        for i in range(n // 2 - 1, -1, -1):
+            self._sift_down(arr, lo, i, n)
+        for end in range(n - 1, 0, -1):
+            arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+            self.swaps += 1
+            self._sift_down(arr, lo, 0, end)
+
+    def _sift_down(self, arr, lo, root, size):
+        while True:
+            largest = root
+            left = 2 * root + 1
+            right = left + 1
+            if left < size:
+                self.comparisons += 1
+                if arr[lo + left] > arr[lo + largest]:
+                    largest = left
+            if right < size:
+                self.comparisons += 1
+                if arr[lo + right] > arr[lo + largest]:
+                    largest = right
+            if largest == root:
+                return
+            arr[lo + root], arr[lo + largest] = arr[lo + largest], arr[lo + root]
+            self.swaps += 1
+            root = largest
+
+    def sort_timed(self, data):
+        arr = list(data)
+        if len(arr) > 1:
+            self._intro_sort_timed(arr, 0, len(arr), 2 * len(arr).bit_length())
+        return arr
+
+    def _intro_sort_timed(self, arr, lo, hi, depth):
+        cutoff = self.cutoff
+        while hi - lo > cutoff:
+            if depth == 0:
+                arr[lo:hi] = HeapSort().sort_timed(arr[lo:hi])
+                return
+            # Partição já ordenada ou invertida
+            i = lo + 1
+            while i < hi and arr[i - 1] <= arr[i]:
+                i += 1
+            if i == hi:
+                return
+            if i == lo + 1:
+                while i < hi and arr[i - 1] >= arr[i]:
+                    i += 1
+                if i == hi:
+                    arr[lo:hi] = arr[lo:hi][::-1]
+                    return
+            depth -= 1
+            pivot = arr[self._choose_pivot_timed(arr, lo, hi)]
+            lt = lo
+            i = lo
+            gt = hi
+            while i < gt:
+                value = arr[i]
+                if value < pivot:
+                    arr[lt], arr[i] = value, arr[lt]
+                    lt += 1
+                    i += 1
+                elif value > pivot:
+                    gt -= 1
+                    arr[i], arr[gt] = arr[gt], value
+                else:
+                    i += 1
+            if lt - lo < hi - gt:
+                self._intro_sort_timed(arr, lo, lt, depth)
+                lo = gt
+            else:
+                self._intro_sort_timed(arr, gt, hi, depth)
+                hi = lt
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    def _choose_pivot_timed(self, arr, lo, hi):
+        def median(a, b, c):
+            if arr[a] < arr[b]:
+                if arr[b] < arr[c]:
+                    return b
+                return c if arr[a] < arr[c] else a
+            if arr[a] < arr[c]:
+                return a
+            return c if arr[b] < arr[c] else b
+
+        mid = (lo + hi) // 2
+        if hi - lo < self.ninther_threshold:
+            return median(lo, mid, hi - 1)
+        step = (hi - lo) // 8
+        return median(
+            median(lo, lo + step, lo + 2 * step),
+            median(mid - step, mid, mid + step),
+            median(hi - 1 - 2 * step, hi - 1 - step, hi - 1),
+        )
+
+
+def reverse_chunked(arr, lo, hi, chunk):
+    # Inverte arr[lo:hi] copiando no máximo 2·chunk elementos por vez
+    while hi - lo > 2 * chunk:
+        left = arr[lo:lo + chunk]
+        arr[lo:lo + chunk] = arr[hi - chunk:hi][::-1]
+        arr[hi - chunk:hi] = left[::-1]
+        lo += chunk
+        hi -= chunk
+    arr[lo:hi] = arr[lo:hi][::-1]
+
+
+class BlockMergeSort(SortStrategy):
+    # Merge sort estável in-place: merges com buffer de √n quando um dos lados cabe,
+    # senão SymMerge por rotações; swaps conta escritas no array
+    run_size = 16
+
+    def __init__(self, use_buffer=True):
+        self.use_buffer = use_buffer
+
+    def sort(self, data):
+        logging.info("Executando BlockMergeSort.")
+        arr = list(data)
+        self.comparisons = 0
+        self.swaps = 0
+        n = len(arr)
+        self.buffer_size = math.isqrt(n) if self.use_buffer else 0
+        self.chunk = max(8, self.buffer_size)
+        for lo in range(0, n, self.run_size):
+            self._insertion_sort(arr, lo, min(lo + self.run_size, n))
+        width = self.run_size
+        while width < n:
+            for lo in range(0, n - width, 2 * width):
+                self._merge(arr, lo, lo + width, min(lo + 2 * width, n))
+            width *= 2
+        return SortResult(arr, self.comparisons, self.swaps)
+
+    def _insertion_sort(self, arr, lo, hi):
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo:
+                self.comparisons += 1
+                if key < arr[j]:
+                    arr[j + 1] = arr[j]
+                    self.swaps += 1
+                    j -= 1
+                else:
+                    break
+            arr[j + 1] = key
+            self.swaps += 1
+
+    def _merge(self, arr, lo, mid, hi):
+        if lo >= mid or mid >= hi:
+            return
+        self.comparisons += 1
+        if not arr[mid] < arr[mid - 1]:
+            return
+        if mid - lo <= self.buffer_size:
+            self._merge_forward(arr, lo, mid, hi)
+        elif hi - mid <= self.buffer_size:
+            self._merge_backward(arr, lo, mid, hi)
+        else:
+            half = (lo + hi) // 2
+            total = half + mid
+            if mid > half:
+                start, r = total - hi, half
+            else:
+                start, r = lo, mid
+            p = total - 1
+            while start < r:
+                c = (start + r) // 2
+                self.comparisons += 1
+                if not arr[p - c] < arr[c]:
+                    start = c + 1
+                else:
+                    r = c
+            end = total - start
+            if start < mid < end:
+                self._rotate(arr, start, mid, end)
+            if lo < start < half:
+                self._merge(arr, lo, start, half)
+            if half < end < hi:
+                self._merge(arr, half, end, hi)
+
+    def _merge_forward(self, arr, lo, mid, hi):
+        left = arr[lo:mid]
+        i, j, k = 0, mid, lo
+        while i < len(left) and j < hi:
+            self.comparisons += 1
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
+                j += 1
+            else:
+                arr[k] = left[i]
+                i += 1
+            self.swaps += 1
+            k += 1
+        arr[k:k + len(left) - i] = left[i:]
+        self.swaps += len(left) - i
+
+    def _merge_backward(self, arr, lo, mid, hi):
+        right = arr[mid:hi]
+        i, j, k = mid - 1, len(right) - 1, hi - 1
+        while i >= lo and j >= 0:
+            self.comparisons += 1
+            if right[j] < arr[i]:
+                arr[k] = arr[i]
+                i -= 1
+            else:
+                arr[k] = right[j]
+                j -= 1
+            self.swaps += 1
+            k -= 1
+        arr[lo:lo + j + 1] = right[:j + 1]
+        self.swaps += j + 1
+
+    def _rotate(self, arr, lo, mid, hi):
+        # Três reversões: cada uma troca (comprimento // 2) pares
+        reverse_chunked(arr, lo, mid, self.chunk)
+        reverse_chunked(arr, mid, hi, self.chunk)
+        reverse_chunked(arr, lo, hi, self.chunk)
+        self.swaps += (mid - lo) // 2 + (hi - mid) // 2 + (hi - lo) // 2
+
+    def sort_timed(self, data):
+        arr = list(data)
+        n = len(arr)
+        run_size = self.run_size
+        self.buffer_size = math.isqrt(n) if self.use_buffer else 0
+        self.chunk = max(8, self.buffer_size)
+        for lo in range(0, n, run_size):
+            hi = min(lo + run_size, n)
+            for i in range(lo + 1, hi):
+                key = arr[i]
+                j = i - 1
+                while j >= lo and key < arr[j]:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                arr[j + 1] = key
+        width = run_size
+        while width < n:
+            for lo in range(0, n - width, 2 * width):
+                self._merge_timed(arr, lo, lo + width, min(lo + 2 * width, n))
+            width *= 2
+        return arr
+
+    def _merge_timed(self, arr, lo, mid, hi):
+        if lo >= mid or mid >= hi or not arr[mid] < arr[mid - 1]:
+            return
+        if mid - lo <= self.buffer_size:
+            left = arr[lo:mid]
+            i, j, k = 0, mid, lo
+            while i < len(left) and j < hi:
+                if arr[j] < left[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                else:
+                    arr[k] = left[i]
+                    i += 1
+                k += 1
+            arr[k:k + len(left) - i] = left[i:]
+        elif hi - mid <= self.buffer_size:
+            right = arr[mid:hi]
+            i, j, k = mid - 1, len(right) - 1, hi - 1
+            while i >= lo and j >= 0:
+                if right[j] < arr[i]:
+                    arr[k] = arr[i]
+                    i -= 1
+                else:
+                    arr[k] = right[j]
+                    j -= 1
+                k -= 1
+            arr[lo:lo + j + 1] = right[:j + 1]
+        else:
+            half = (lo + hi) // 2
+            total = half + mid
+            if mid > half:
+                start, r = total - hi, half
+            else:
+                start, r = lo, mid
+            p = total - 1
+            while start < r:
+                c = (start + r) // 2
+                if not arr[p - c] < arr[c]:
+                    start = c + 1
+                else:
+                    r = c
+            end = total - start
+            if start < mid < end:
+                reverse_chunked(arr, start, mid, self.chunk)
+                reverse_chunked(arr, mid, end, self.chunk)
+                reverse_chunked(arr, start, end, self.chunk)
+            if lo < start < half:
+                self._merge_timed(arr, lo, start, half)
+            if half < end < hi:
+                self._merge_timed(arr, half, end, hi)
+
 
 #########################
 # Funções de Gerenciamento de Dados e Benchmark
 #########################
-def generate_data(file_name, size):
-    data = [random.randint(0, 100000) for _ in range(size)]
+def generate_data(file_name, size, distribution=None):
+    if distribution is None:
+        data = [random.randint(0, 100000) for _ in range(size)]
+    else:
+        data = generate_distribution(distribution, size, max_value=100000)
     with open(file_name, "w") as f:
         f.write("\n".join(map(str, data)))
-    logging.info(f"Dados com {size} números salvos em {file_name}.")
+    logging.info(f"Dados com {size} números ({distribution or 'uniform'}) salvos em {file_name}.")
 
 
 def load_data(file_name):
@@ -369,61 +1161,349 @@ def load_data(file_name):
     return [int(x) for x in lines]
 
 
-def benchmark_sort(strategy, data, repetitions=3):
-    total_time = 0
-    total_comparisons = 0
-    total_swaps = 0
-    for _ in range(repetitions):
-        start = time.time()
-        result = strategy.sort(data)
-        elapsed = time.time() - start  # tempo em segundos
-        total_time += elapsed
-        total_comparisons += result.comparisons
-        total_swaps += result.swaps
-    avg_time = total_time / repetitions
-    avg_comparisons = total_comparisons / repetitions
-    avg_swaps = total_swaps / repetitions
-    return avg_time, avg_comparisons, avg_swaps
+def benchmark_sort(strategy, data, repetitions=3, warmups=1, max_repetitions=50, target_rel_ci=0.03,
+                   max_seconds=30.0):
+    # Passada cronometrada: só o modo enxuto, sem contadores. Aquece, desliga o GC e
+    # repete até o IC da mediana estabilizar; repetitions é o mínimo de amostras.
+    return measure(
+        lambda: strategy.sort_timed(data),
+        warmups=warmups,
+        min_repetitions=repetitions,
+        max_repetitions=max(repetitions, max_repetitions),
+        target_rel_ci=target_rel_ci,
+        max_seconds=max_seconds,
+    )
+
+
+def count_operations(strategy, data):
+    # Passada instrumentada: as contagens são determinísticas, uma execução basta.
+    # O tempo dela inclui o custo dos contadores e só serve para comparação.
+    start = time.perf_counter()
+    result = strategy.sort(data)
+    elapsed = time.perf_counter() - start
+    return result.comparisons, result.swaps, elapsed
+
+
+#########################
+# Perfil de Memória
+#########################
+class MemoryProfile:
+    def __init__(self, peak_bytes, retained_blocks, rss_delta_bytes):
+        self.peak_bytes = peak_bytes
+        self.retained_blocks = retained_blocks
+        self.rss_delta_bytes = rss_delta_bytes
+
+    def __str__(self):
+        rss = "n/d" if self.rss_delta_bytes is None else f"{self.rss_delta_bytes / 1024:.0f} KiB"
+        return (f"Pico de memória={self.peak_bytes / 1024:.0f} KiB, "
+                f"Blocos retidos ao final={self.retained_blocks}, Delta RSS={rss}")
+
+
+def current_rss_bytes():
+    # RSS atual via /proc no Linux; nos demais sistemas, o pico (ru_maxrss) do processo
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def profile_memory(strategy, data):
+    """Executa uma ordenação (modo enxuto) sob o tracemalloc.
+
+    É uma passada separada da cronometrada: o rastreamento deixa tudo bem mais lento.
+    """
+    rss_before = current_rss_bytes()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline_traced = tracemalloc.get_traced_memory()[0]
+        result = strategy.sort_timed(data)
+        peak = tracemalloc.get_traced_memory()[1] - baseline_traced
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    rss_after = current_rss_bytes()
+    del result
+    # Diferença entre snapshots: só os blocos que sobrevivem à ordenação, não todas as alocações
+    retained_blocks = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+    )
+    rss_delta = None if rss_before is None or rss_after is None else rss_after - rss_before
+    return MemoryProfile(peak, retained_blocks, rss_delta)
+
+
+def benchmark_strategy(name, data=None):
+    """Versão instrumentada (deste arquivo) da estratégia registrada com esse rótulo ou nome.
+
+    Com data, aplica o perfil de autotune.py (backend 'benchmark', ex.: minrun do TimSort)
+    para o tamanho e a distribuição dessa entrada.
+    """
+    spec = get_spec(name)
+    if not spec.supports_counting:
+        raise KeyError(f"{name} não tem versão instrumentada.")
+    # As classes instrumentadas têm o mesmo nome das classes do pacote
+    strategy = globals()[spec.class_name](**spec.kwargs)
+    if data is not None:
+        from algorithms.tuning import load_profile
+        profile = load_profile()
+        if profile is not None:
+            strategy = profile.apply(strategy, len(data), backend='benchmark', sample=data)
+    return strategy
+
+
+def build_strategies(data=None):
+    # A lista e a ordem vêm do registro em SortAlgorithms/algorithms/registry.py
+    return {spec.label: benchmark_strategy(spec.name, data) for spec in specs() if spec.supports_counting}
+
+
+def report_result(name, size, stats, comparisons, swaps, instrumented_time, memory=None):
+    metrics = ALGORITHM_DURATION is not None
+    if metrics:
+        ALGORITHM_DURATION.labels(algorithm=name).observe(stats.median)
+        ALGORITHM_INSTRUMENTED_DURATION.labels(algorithm=name).observe(instrumented_time)
+        ALGORITHM_COMPARISONS.labels(algorithm=name).inc(comparisons)
+        ALGORITHM_SWAPS.labels(algorithm=name).inc(swaps)
+    message = (
+        f"{name}: Tamanho={size}, Tempo: {stats}, "
+        f"Tempo instrumentado={instrumented_time*1000:.2f} ms, Comparações={comparisons}, Trocas={swaps}"
+    )
+    if memory is not None:
+        if metrics:
+            ALGORITHM_PEAK_MEMORY.labels(algorithm=name).set(memory.peak_bytes)
+            ALGORITHM_RETAINED_BLOCKS.labels(algorithm=name).set(memory.retained_blocks)
+            if memory.rss_delta_bytes is not None:
+                ALGORITHM_RSS_DELTA.labels(algorithm=name).set(memory.rss_delta_bytes)
+        message += f", {memory}"
+    logging.info(message)
+    print(message)
+
+
+def benchmark_selection(data, k, repetitions=3, warmups=1, max_repetitions=50, target_rel_ci=0.03):
+    """Compara seleção (nth_element, partial_sort, top-k) com a ordenação completa via SortContext.
+
+    Todas as variantes copiam a entrada antes de rodar, então a cópia entra em todas igualmente.
+    """
+    from algorithms.sort_context import SortContext
+
+    context = SortContext(create_strategy("tim_sort"))
+    k = max(1, min(k, len(data)))
+    operations = {
+        f"nth_element(k={k})": lambda: context.execute_nth_element(list(data), k - 1),
+        f"partial_sort(k={k})": lambda: context.execute_partial_sort(list(data), k),
+        f"top_k(k={k})": lambda: context.execute_top_k(iter(data), k),
+        "full_sort": lambda: context.execute_sort(list(data)),
+    }
+    results = {}
+    for name, operation in operations.items():
+        stats = measure(operation, warmups=warmups, min_repetitions=repetitions,
+                        max_repetitions=max(repetitions, max_repetitions), target_rel_ci=target_rel_ci)
+        if ALGORITHM_DURATION is not None:
+            ALGORITHM_DURATION.labels(algorithm=name).observe(stats.median)
+        message = f"{name}: Tamanho={len(data)}, Tempo: {stats}"
+        logging.info(message)
+        print(message)
+        results[name] = stats
+    return results
+
+
+#########################
+# Benchmark Paralelo (pool de processos)
+#########################
+def available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(cpus, next_slot):
+    # Cada worker recebe um slot distinto e fica preso a uma única CPU,
+    # evitando migrações que distorcem as medições
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+
+def _run_benchmark_job(name, repetition, dataset_name, data, warmups=1):
+    strategy = benchmark_strategy(name, data)
+    for _ in range(warmups):
+        strategy.sort_timed(data)
+    elapsed_ns = time_once_ns(lambda: strategy.sort_timed(data))
+    return name, repetition, dataset_name, elapsed_ns
+
+
+def _run_counting_job(name, dataset_name, data):
+    return name, dataset_name, count_operations(benchmark_strategy(name, data), data)
+
+
+def _run_memory_job(name, dataset_name, data):
+    return name, dataset_name, profile_memory(benchmark_strategy(name, data), data)
+
+
+def parallel_benchmark(names, datasets, repetitions=3, max_workers=None, pin_cpus=False, warmups=1,
+                       memory=False):
+    """Executa cada job (algoritmo, repetição, dataset) em um ProcessPoolExecutor.
+
+    As repetições cronometradas usam o modo enxuto; cada (algoritmo, dataset) ganha
+    ainda um job instrumentado para contar operações.
+    Com memory=True, um terceiro job mede a memória sob o tracemalloc.
+    Retorna {(algoritmo, dataset): (TimingStats, comparações, trocas, tempo instrumentado, MemoryProfile)}.
+    """
+    cpus = available_cpus()
+    workers = max_workers or len(cpus)
+    if pin_cpus:
+        initializer = _pin_worker
+        initargs = (cpus, multiprocessing.Value("i", 0))
+    else:
+        initializer = None
+        initargs = ()
+
+    runs = defaultdict(list)
+    counts = {}
+    profiles = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        timed_futures = [
+            executor.submit(_run_benchmark_job, name, repetition, dataset_name, data, warmups)
+            for name in names
+            for dataset_name, data in datasets.items()
+            for repetition in range(repetitions)
+        ]
+        counting_futures = [
+            executor.submit(_run_counting_job, name, dataset_name, data)
+            for name in names
+            for dataset_name, data in datasets.items()
+        ]
+        memory_futures = [
+            executor.submit(_run_memory_job, name, dataset_name, data)
+            for name in names
+            for dataset_name, data in datasets.items()
+        ] if memory else []
+        for future in as_completed(timed_futures):
+            name, repetition, dataset_name, elapsed_ns = future.result()
+            logging.info(
+                f"{name} [{dataset_name}] repetição {repetition + 1}: {elapsed_ns/1e6:.2f} ms"
+            )
+            runs[(name, dataset_name)].append(elapsed_ns)
+        for future in as_completed(counting_futures):
+            name, dataset_name, operations = future.result()
+            counts[(name, dataset_name)] = operations
+        for future in as_completed(memory_futures):
+            name, dataset_name, profile = future.result()
+            profiles[(name, dataset_name)] = profile
+
+    results = {}
+    for key, samples in runs.items():
+        comparisons, swaps, instrumented_time = counts[key]
+        results[key] = (TimingStats(samples), comparisons, swaps, instrumented_time, profiles.get(key))
+    return results
 
 
 #########################
 # Função Principal
 #########################
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de ordenação.")
+    parser.add_argument("--parallel", action="store_true", help="executa os jobs em um pool de processos")
+    parser.add_argument("--workers", type=int, default=None, help="número máximo de processos simultâneos")
+    parser.add_argument("--pin-cpus", action="store_true", help="fixa cada worker em uma CPU")
+    parser.add_argument("--repetitions", type=int, default=3, help="mínimo de repetições cronometradas")
+    parser.add_argument("--warmups", type=int, default=1, help="execuções descartadas antes de medir")
+    parser.add_argument("--max-repetitions", type=int, default=50)
+    parser.add_argument("--target-ci", type=float, default=0.03,
+                        help="para de repetir quando a meia-largura do IC95 da mediana fica abaixo dessa fração")
+    parser.add_argument("--memory", action="store_true",
+                        help="mede pico de memória, blocos retidos e delta de RSS (passada extra com tracemalloc)")
+    parser.add_argument("--selection-k", type=int, default=None,
+                        help="também mede nth_element, partial_sort e top-k para esse k")
+    parser.add_argument("--baseline", default=None, help="compara com um baseline salvo e aponta regressões")
+    parser.add_argument("--save-baseline", default=None, help="salva as medições como baseline (JSON)")
+    parser.add_argument("--baseline-label", default=None)
+    parser.add_argument("--alpha", type=float, default=0.01, help="nível de significância do teste de regressão")
+    parser.add_argument("--min-slowdown", type=float, default=0.05,
+                        help="piora mínima da mediana para contar como regressão")
+    parser.add_argument("--once", action="store_true",
+                        help="encerra ao final (código 1 se houver regressão) em vez de aguardar o Prometheus")
+    return parser.parse_args(argv)
+
+
+def check_regressions(baseline_path, timings, alpha=0.01, min_slowdown=0.05):
+    comparisons = compare_to_baseline(load_baseline(baseline_path), timings, alpha, min_slowdown)
+    for comparison in comparisons:
+        if comparison.regression:
+            logging.warning(f"Regressão: {comparison}")
+        else:
+            logging.info(f"Comparação com baseline: {comparison}")
+        print(comparison)
+    return [comparison for comparison in comparisons if comparison.regression]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    init_logging()
+    init_metrics()
+    from prometheus_client import start_http_server
+
     # Inicia o servidor HTTP do Prometheus na porta 8000
     start_http_server(8000)
     logging.info("Endpoint de métricas disponível em http://localhost:8000/metrics")
 
+    if (args.baseline or args.save_baseline) and args.repetitions < MIN_BASELINE_SAMPLES:
+        # O teste de regressão precisa de amostras suficientes dos dois lados
+        logging.info(f"Repetições elevadas de {args.repetitions} para {MIN_BASELINE_SAMPLES} por causa do baseline.")
+        args.repetitions = MIN_BASELINE_SAMPLES
+
     data_file = "data.txt"
     if not os.path.exists(data_file):
         generate_data(data_file, 10000)
     data = load_data(data_file)
 
-    strategies = {
-        "BubbleSort": BubbleSort(),
-        "InsertionSort": InsertionSort(),
-        "SelectionSort": SelectionSort(),
-        "QuickSort": QuickSort(),
-        "MergeSort": MergeSort(),
-        "TimSort": TimSort(),
-        "HeapSort": HeapSort(),
-        "CountingSort": CountingSort(),
-        "RadixSort": RadixSort(),
-        "ShellSort": ShellSort(),
-    }
+    strategies = build_strategies(data)
 
     # Executa o benchmark para cada algoritmo e atualiza as métricas do Prometheus
-    for name, strategy in strategies.items():
-        avg_time, avg_comparisons, avg_swaps = benchmark_sort(strategy, data)
-        ALGORITHM_DURATION.labels(algorithm=name).observe(avg_time)
-        ALGORITHM_COMPARISONS.labels(algorithm=name).inc(avg_comparisons)
-        ALGORITHM_SWAPS.labels(algorithm=name).inc(avg_swaps)
-        logging.info(
-            f"{name}: Tamanho={len(data)}, Tempo médio={avg_time*1000:.2f} ms, Comparações={avg_comparisons}, Trocas={avg_swaps}"
-        )
-        print(
-            f"{name}: Tamanho={len(data)}, Tempo médio={avg_time*1000:.2f} ms, Comparações={avg_comparisons}, Trocas={avg_swaps}"
+    timings = {}
+    if args.parallel:
+        results = parallel_benchmark(
+            list(strategies),
+            {data_file: data},
+            repetitions=args.repetitions,
+            max_workers=args.workers,
+            pin_cpus=args.pin_cpus,
+            warmups=args.warmups,
+            memory=args.memory,
         )
+        for name in strategies:
+            report_result(name, len(data), *results[(name, data_file)])
+            timings[name] = results[(name, data_file)][0]
+    else:
+        for name, strategy in strategies.items():
+            stats = benchmark_sort(strategy, data, args.repetitions, args.warmups, args.max_repetitions, args.target_ci)
+            comparisons, swaps, instrumented_time = count_operations(strategy, data)
+            memory = profile_memory(strategy, data) if args.memory else None
+            report_result(name, len(data), stats, comparisons, swaps, instrumented_time, memory)
+            timings[name] = stats
+
+    if args.selection_k is not None:
+        timings.update(benchmark_selection(
+            data, args.selection_k, args.repetitions, args.warmups, args.max_repetitions, args.target_ci
+        ))
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, timings, args.baseline_label)
+        logging.info(f"Baseline salvo em {args.save_baseline}.")
+    regressions = []
+    if args.baseline:
+        regressions = check_regressions(args.baseline, timings, args.alpha, args.min_slowdown)
+    if args.once:
+        return 1 if regressions else 0
 
     # Mantém o programa em execução para que o Prometheus possa raspar as métricas
     print("Aguardando... Pressione Ctrl+C para encerrar.")
@@ -432,4 +1512,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import gc
+import json
+import logging
+import math
+import platform
+import time
+from datetime import datetime, timezone
+
+#########################
+# Medição com estatística robusta
+#########################
+BASELINE_FORMAT_VERSION = 1
+Z_95 = 1.959963984540054
+# Com menos amostras por lado o teste de Mann-Whitney não alcança p < 0,01
+MIN_BASELINE_SAMPLES = 8
+# Até este tamanho (por lado) e sem empates, o p-valor usa a distribuição exata de U
+EXACT_U_MAX_SAMPLES = 30
+
+
+def percentile(sorted_values, fraction):
+    # Interpolação linear entre as duas amostras vizinhas
+    if not sorted_values:
+        raise ValueError("Sem amostras.")
+    position = (len(sorted_values) - 1) * fraction
+    low = math.floor(position)
+    high = math.ceil(position)
+    weight = position - low
+    return sorted_values[low] * (1 - weight) + sorted_values[high] * weight
+
+
+class TimingStats:
+    def __init__(self, samples_ns):
+        self.samples_ns = list(samples_ns)
+        ordered = sorted(self.samples_ns)
+        n = len(ordered)
+        self.repetitions = n
+        self.median_ns = percentile(ordered, 0.5)
+        self.q1_ns = percentile(ordered, 0.25)
+        self.q3_ns = percentile(ordered, 0.75)
+        self.mean_ns = sum(ordered) / n
+        # IC de 95% da mediana por estatísticas de ordem (sem supor normalidade)
+        half_width = Z_95 * math.sqrt(n) / 2
+        self.ci_low_ns = ordered[max(0, math.ceil(n / 2 - half_width) - 1)]
+        self.ci_high_ns = ordered[min(n - 1, math.floor(n / 2 + half_width))]
+
+    @property
+    def median(self):
+        return self.median_ns / 1e9
+
+    @property
+    def iqr(self):
+        return (self.q3_ns - self.q1_ns) / 1e9
+
+    @property
+    def relative_ci(self):
+        if self.median_ns == 0:
+            return 0.0
+        return (self.ci_high_ns - self.ci_low_ns) / 2 / self.median_ns
+
+    def to_dict(self):
+        return {
+            "repetitions": self.repetitions,
+            "median_ns": self.median_ns,
+            "q1_ns": self.q1_ns,
+            "q3_ns": self.q3_ns,
+            "ci95_ns": [self.ci_low_ns, self.ci_high_ns],
+            "mean_ns": self.mean_ns,
+            "samples_ns": self.samples_ns,
+        }
+
+    def __str__(self):
+        return (f"mediana={self.median*1000:.2f} ms, IQR={self.iqr*1000:.2f} ms, "
+                f"IC95=[{self.ci_low_ns/1e6:.2f}, {self.ci_high_ns/1e6:.2f}] ms, n={self.repetitions}")
+
+
+def time_once_ns(fn, disable_gc=True):
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        fn()
+        return time.perf_counter_ns() - start
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+
+def measure(fn, warmups=1, min_repetitions=5, max_repetitions=50, target_rel_ci=0.03,
+            max_seconds=30.0, disable_gc=True):
+    """Executa fn até o IC da mediana ficar abaixo de target_rel_ci (ou estourar os limites)."""
+    for _ in range(warmups):
+        fn()
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_repetitions:
+        samples.append(time_once_ns(fn, disable_gc))
+        if len(samples) >= min_repetitions:
+            if TimingStats(samples).relative_ci <= target_rel_ci:
+                break
+            if time.perf_counter() - started > max_seconds:
+                break
+    return TimingStats(samples)
+
+
+#########################
+# Baselines e detecção de regressão
+#########################
+def save_baseline(path, results, label=None):
+    """results: {algoritmo: TimingStats}."""
+    for name, stats in results.items():
+        if stats.repetitions < MIN_BASELINE_SAMPLES:
+            logging.warning(f"Baseline de {name} com só {stats.repetitions} amostras "
+                            f"(mínimo recomendado: {MIN_BASELINE_SAMPLES}).")
+    with open(path, "w") as f:
+        json.dump({
+            "format_version": BASELINE_FORMAT_VERSION,
+            "label": label,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "machine": {"platform": platform.platform(), "processor": platform.processor(),
+                        "python": platform.python_version()},
+            "results": {name: stats.to_dict() for name, stats in results.items()},
+        }, f, indent=2)
+
+
+def load_baseline(path):
+    with open(path, "r") as f:
+        baseline = json.load(f)
+    if baseline.get("format_version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Versão de baseline não suportada: {baseline.get('format_version')}")
+    return {name: TimingStats(entry["samples_ns"]) for name, entry in baseline["results"].items()}
+
+
+_u_counts = {}
+
+
+def _u_distribution(n1, n2):
+    # Quantas ordenações das n1 + n2 amostras dão cada valor de U (sem empates):
+    # a maior amostra vem de current (soma n1 pares) ou de baseline
+    key = (n1, n2)
+    counts = _u_counts.get(key)
+    if counts is None:
+        if n1 == 0 or n2 == 0:
+            counts = [1]
+        else:
+            from_current = _u_distribution(n1, n2 - 1)
+            from_baseline = _u_distribution(n1 - 1, n2)
+            counts = [0] * (n1 * n2 + 1)
+            for u, count in enumerate(from_baseline):
+                counts[u] += count
+            for u, count in enumerate(from_current):
+                counts[u + n1] += count
+        _u_counts[key] = counts
+    return counts
+
+
+def mann_whitney_greater(baseline, current):
+    """p-valor unilateral de Mann-Whitney U para 'current é mais lento que baseline'.
+
+    Amostras pequenas sem empates usam a distribuição exata de U; as demais, a
+    aproximação normal com correção para empates e de continuidade.
+    """
+    n1 = len(baseline)
+    n2 = len(current)
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum_current = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u_current = rank_sum_current - n2 * (n2 + 1) / 2
+    if tie_term == 0 and 0 < n1 <= EXACT_U_MAX_SAMPLES and 0 < n2 <= EXACT_U_MAX_SAMPLES:
+        counts = _u_distribution(n1, n2)
+        return sum(counts[int(u_current):]) / sum(counts)
+    mean_u = n1 * n2 / 2
+    total = n1 + n2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_current - mean_u - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(n1, n2):
+    """Menor p-valor possível com n1 e n2 amostras (current inteiro acima de baseline)."""
+    return mann_whitney_greater(range(n1), range(n1, n1 + n2))
+
+
+class Comparison:
+    def __init__(self, name, baseline, current, p_value, regression):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        self.ratio = current.median_ns / baseline.median_ns if baseline.median_ns else float("inf")
+        self.p_value = p_value
+        self.regression = regression
+
+    def __str__(self):
+        flag = "REGRESSÃO" if self.regression else "ok"
+        return (f"{self.name}: {self.baseline.median*1000:.2f} ms -> {self.current.median*1000:.2f} ms "
+                f"({(self.ratio - 1) * 100:+.1f}%, p={self.p_value:.4f}) {flag}")
+
+
+def compare_to_baseline(baseline, results, alpha=0.01, min_slowdown=0.05):
+    """Marca como regressão o que é significativamente (p < alpha) e relevantemente mais lento."""
+    comparisons = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        reference = baseline[name]
+        floor = min_p_value(reference.repetitions, current.repetitions)
+        if floor >= alpha:
+            logging.warning(f"{name}: com {reference.repetitions} x {current.repetitions} amostras o menor "
+                            f"p-valor possível é {floor:.4f} >= alpha={alpha}; nenhuma regressão pode ser apontada.")
+        p_value = mann_whitney_greater(reference.samples_ns, current.samples_ns)
+        slower = current.median_ns > reference.median_ns * (1 + min_slowdown)
+        comparisons.append(Comparison(name, reference, current, p_value, p_value < alpha and slower))
+    return comparisons